@@ -8,19 +8,34 @@ Aajtak-specific AskHandler with Hindi/Hinglish transliteration support.
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 
 from nlweb_core.config import get_config, override_scoring_provider
+from nlweb_core.conversation_saver import get_conversation_saver
 from nlweb_core.handler import AskHandler, OutputMethod
+from nlweb_core.postQueryProcessing import PostQueryProcessing
 from nlweb_core.protocol.models import AskRequest
 from nlweb_core.query_analysis.query_analysis import (
     DefaultQueryAnalysisHandler,
     query_analysis_tree,
 )
+from nlweb_core.ranking import Ranking
 from nlweb_core.request_context import set_request_id
+from nlweb_core.retriever import enrich_results_from_object_storage
 from nlweb_core.site_config import get_elicitation_handler
 
 logger = logging.getLogger(__name__)
 
+# Decontextualization prompt keyed by (has previous queries, has context text).
+# Every prompt also transliterates Hinglish and classifies recency, so even
+# queries without context go through one.
+_DECONTEXTUALIZER_PROMPTS: dict[tuple[bool, bool], str] = {
+    (False, False): "NoContextTransliteratorWithRecency",
+    (True, False): "PrevQueryDecontextualizerHindiWithRecency",
+    (False, True): "FullContextDecontextualizerHindiWithRecency",
+    (True, True): "FullContextDecontextualizerHindiWithRecency",
+}
+
 
 class AajtakAskHandler(AskHandler):
     """Handler for aajtak.in with Hindi/Hinglish transliteration support."""
@@ -96,9 +111,6 @@ class AajtakAskHandler(AskHandler):
         4. Rank all together with LLM scorer and apply threshold
         5. If seeking recent info: reorder into fresh-first bins (maintaining score order within bins)
         """
-        from nlweb_core.ranking import Ranking
-        from nlweb_core.retriever import enrich_results_from_object_storage
-
         config = get_config()
         vectordb_client = config.get_retrieval_provider("default")
 
@@ -199,8 +211,6 @@ class AajtakAskHandler(AskHandler):
         Returns:
             Reordered results with fresh items first, old items second
         """
-        from email.utils import parsedate_to_datetime
-
         fresh_bin = []
         old_bin = []
 
@@ -262,42 +272,19 @@ class AajtakAskHandler(AskHandler):
         prev_queries = (context.prev or []) if context else []
         context_text = context.text if context else None
 
-        if not prev_queries and context_text is None:
-            # No context - transliterate with recency classification
-            result = await DefaultQueryAnalysisHandler(
-                request,
-                prompt_ref="NoContextTransliteratorWithRecency",
-                root_node=query_analysis_tree,
-                site_config=site_config,
-            ).do()
-            if result:
-                self.is_seeking_recent_info = result.get("is_seeking_recent_info", False)
-                return result.get("decontextualized_query")
-            return None
-        elif prev_queries and context_text is None:
-            # Decontextualize with prev queries + transliteration + recency classification
-            result = await DefaultQueryAnalysisHandler(
-                request,
-                prompt_ref="PrevQueryDecontextualizerHindiWithRecency",
-                root_node=query_analysis_tree,
-                site_config=site_config,
-            ).do()
-            if result:
-                self.is_seeking_recent_info = result.get("is_seeking_recent_info", False)
-                return result.get("decontextualized_query")
-            return None
-        else:
-            # Decontextualize with full context + transliteration + recency classification
-            result = await DefaultQueryAnalysisHandler(
-                request,
-                prompt_ref="FullContextDecontextualizerHindiWithRecency",
-                root_node=query_analysis_tree,
-                site_config=site_config,
-            ).do()
-            if result:
-                self.is_seeking_recent_info = result.get("is_seeking_recent_info", False)
-                return result.get("decontextualized_query")
-            return None
+        prompt_ref = _DECONTEXTUALIZER_PROMPTS[
+            (bool(prev_queries), context_text is not None)
+        ]
+        result = await DefaultQueryAnalysisHandler(
+            request,
+            prompt_ref=prompt_ref,
+            root_node=query_analysis_tree,
+            site_config=site_config,
+        ).do()
+        if result:
+            self.is_seeking_recent_info = result.get("is_seeking_recent_info", False)
+            return result.get("decontextualized_query")
+        return None
 
     async def _check_elicitation(self, request: AskRequest) -> dict | None:
         """
@@ -378,8 +365,9 @@ class AajtakAskHandler(AskHandler):
         final_ranked_answers: list[dict],
     ) -> None:
         """Execute post-query processing (summarization, conversation storage, etc.)."""
-        from nlweb_core.conversation_saver import ConversationSaver
-        from nlweb_core.postQueryProcessing import PostQueryProcessing
+        # The turn is only queued here, so the background write overlaps
+        # with summarization instead of waiting for it
+        await get_conversation_saver().save(request, final_ranked_answers)
 
         prefer = request.prefer
         await PostQueryProcessing(site=request.query.site).process(
@@ -391,5 +379,3 @@ class AajtakAskHandler(AskHandler):
             ],
             send_results=lambda results: self._send_results(output_method, results),
         )
-
-        await ConversationSaver().save(request, final_ranked_answers)
@@ -10,17 +10,24 @@ Backwards compatibility is not guaranteed at this time.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
+import pickle
+import re
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-import yaml
-from dotenv import load_dotenv
-
-from nlweb_core.provider_map import ProviderMap
+from nlweb_core.provider_map import NameOverride, ProviderMap
 
 if TYPE_CHECKING:
     from nlweb_core.embedding import EmbeddingProvider
@@ -36,8 +43,11 @@ logger = logging.getLogger(__name__)
 # Configuration Dataclasses
 # =============================================================================
 
+# Section configs are frozen: they are shared by every request, so derive a
+# variant with dataclasses.replace() instead of mutating in place.
 
-@dataclass
+
+@dataclass(frozen=True)
 class EmbeddingConfig:
     """Configuration for a single embedding provider."""
 
@@ -46,7 +56,7 @@ class EmbeddingConfig:
     options: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class RetrievalConfig:
     """Configuration for a single retrieval provider."""
 
@@ -55,7 +65,7 @@ class RetrievalConfig:
     options: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ServerConfig:
     host: str = "localhost"
     enable_cors: bool = True
@@ -63,7 +73,7 @@ class ServerConfig:
     timeout: int = 30
 
 
-@dataclass
+@dataclass(frozen=True)
 class NLWebConfig:
     sites: list[str]
     json_data_folder: str = "./data/json"
@@ -75,13 +85,14 @@ class NLWebConfig:
     analyze_query_enabled: bool = False
     decontextualize_enabled: bool = True
     required_info_enabled: bool = True
+    speculative_retrieval_enabled: bool = True
     aggregation_enabled: bool = False
     who_endpoint_enabled: bool = True
     api_keys: dict[str, str] = field(default_factory=dict)
     who_endpoint: str = "http://localhost:8000/who"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConversationStorageConfig:
     type: str
     enabled: bool = True
@@ -107,9 +118,11 @@ class ConversationStorageConfig:
     vector_type: dict[str, Any] | None = None
     rrf: dict[str, Any] | None = None
     knn: dict[str, Any] | None = None
+    pool_min_size: int = 5
+    pool_max_size: int = 25
 
 
-@dataclass
+@dataclass(frozen=True)
 class ObjectStorageConfig:
     """Configuration for a single object storage provider."""
 
@@ -118,14 +131,14 @@ class ObjectStorageConfig:
     options: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SiteConfigStorageConfig:
     import_path: str
     class_name: str
     options: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScoringModelConfig:
     """Configuration for a single scoring model provider."""
 
@@ -134,7 +147,7 @@ class ScoringModelConfig:
     options: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class GenerativeModelConfig:
     """Configuration for a single generative model provider."""
 
@@ -143,14 +156,17 @@ class GenerativeModelConfig:
     options: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class RankingConfig:
     scoring_questions: list[str] = field(
         default_factory=lambda: ["Is this item relevant to the query?"]
     )
+    # "per_item" scores each item in its own LLM call; "batch" asks the
+    # scoring provider to score all items together (see score_combined)
+    strategy: str = "per_item"
 
 
-@dataclass
+@dataclass(frozen=True)
 class StorageBehaviorConfig:
     store_anonymous: bool = True
     max_conversations_per_thread: int = 100
@@ -168,13 +184,29 @@ class StorageBehaviorConfig:
 # =============================================================================
 
 
+def _read_only_table(table: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Return a read-only copy of a provider name -> config table.
+
+    Names are interned so lookups with the string literals used at call sites
+    (e.g. get_scoring_provider("default")) match by identity.
+    """
+    return MappingProxyType(
+        {
+            sys.intern(name) if isinstance(name, str) else name: cfg
+            for name, cfg in table.items()
+        }
+    )
+
+
 @dataclass
 class AppConfig:
     """
     Main application configuration.
 
     This is a dataclass that holds all configuration values. The loading logic
-    is in the separate load_config() function.
+    is in the separate load_config() function, which constructs it positionally,
+    so keep field order in sync with that call when adding fields.
     """
 
     # Directories
@@ -182,37 +214,39 @@ class AppConfig:
     base_output_directory: str | None = None
 
     # Generative Model Providers
-    generative_model_providers: dict[str, GenerativeModelConfig] = field(
+    generative_model_providers: Mapping[str, GenerativeModelConfig] = field(
         default_factory=dict
     )
 
     # Embedding Configuration
-    embedding_providers: dict[str, EmbeddingConfig] = field(default_factory=dict)
+    embedding_providers: Mapping[str, EmbeddingConfig] = field(default_factory=dict)
     preferred_embedding_provider: str | None = None
 
     # Retrieval Providers
-    retrieval_providers: dict[str, RetrievalConfig] = field(default_factory=dict)
+    retrieval_providers: Mapping[str, RetrievalConfig] = field(default_factory=dict)
 
     # Conversation Storage
     conversation_storage: ConversationStorageConfig | None = None
     conversation_storage_behavior: StorageBehaviorConfig | None = None
-    conversation_storage_endpoints: dict[str, ConversationStorageConfig] = field(
+    conversation_storage_endpoints: Mapping[str, ConversationStorageConfig] = field(
         default_factory=dict
     )
     conversation_storage_default: str = "qdrant_local"
 
     # Object Storage Providers
-    object_storage_providers: dict[str, ObjectStorageConfig] = field(
+    object_storage_providers: Mapping[str, ObjectStorageConfig] = field(
         default_factory=dict
     )
 
     # Site Config Providers
-    site_config_providers: dict[str, SiteConfigStorageConfig] = field(
+    site_config_providers: Mapping[str, SiteConfigStorageConfig] = field(
         default_factory=dict
     )
 
     # Scoring Model Providers
-    scoring_model_providers: dict[str, ScoringModelConfig] = field(default_factory=dict)
+    scoring_model_providers: Mapping[str, ScoringModelConfig] = field(
+        default_factory=dict
+    )
 
     # Ranking Configuration (use get_ranking_config() to access)
     _ranking: RankingConfig | None = None
@@ -227,95 +261,139 @@ class AppConfig:
     nlweb_gateway: str = "nlwm.azurewebsites.net"
     test_user: str = "anonymous"
 
-    # OAuth Configuration
-    oauth_providers: dict[str, Any] = field(default_factory=dict)
-    oauth_session_secret: str | None = None
-    oauth_token_expiration: int = 86400
-    oauth_require_auth: bool = False
-    oauth_anonymous_endpoints: list[str] = field(default_factory=list)
+    # Derived in __post_init__ (config is not changed after load)
+    _is_development: bool = field(init=False, repr=False, compare=False)
+    _is_testing: bool = field(init=False, repr=False, compare=False)
+    _default_embedding_config: EmbeddingConfig | None = field(
+        init=False, repr=False, compare=False
+    )
+    # OAuth settings, read from config_oauth.* on first access to an oauth_*
+    # property so deployments that never use OAuth skip parsing it
+    _oauth: tuple[dict[str, Any], str | None, int, bool, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Provider tables are never modified after load; expose them read-only.
+        self.generative_model_providers = _read_only_table(
+            self.generative_model_providers
+        )
+        self.embedding_providers = _read_only_table(self.embedding_providers)
+        self.retrieval_providers = _read_only_table(self.retrieval_providers)
+        self.conversation_storage_endpoints = _read_only_table(
+            self.conversation_storage_endpoints
+        )
+        self.object_storage_providers = _read_only_table(self.object_storage_providers)
+        self.site_config_providers = _read_only_table(self.site_config_providers)
+        self.scoring_model_providers = _read_only_table(self.scoring_model_providers)
+
+        mode = self.mode.lower()
+        self._is_development = mode == "development"
+        self._is_testing = mode == "testing"
+
+        preferred = self.preferred_embedding_provider
+        if preferred and preferred not in self.embedding_providers:
+            logger.warning(
+                f"Preferred embedding provider '{preferred}' is not configured; "
+                "ignoring"
+            )
+            self.preferred_embedding_provider = preferred = None
+        if preferred:
+            self.preferred_embedding_provider = sys.intern(preferred)
+        self._default_embedding_config = (
+            self.embedding_providers[preferred] if preferred else None
+        )
 
     # Query methods
     def is_development_mode(self) -> bool:
         """Returns True if the system is running in development mode."""
-        return self.mode.lower() == "development"
+        return self._is_development
 
     def is_testing_mode(self) -> bool:
         """Returns True if the system is running in testing mode."""
-        return self.mode.lower() == "testing"
+        return self._is_testing
 
     def should_raise_exceptions(self) -> bool:
         """Returns True if exceptions should be raised instead of caught."""
-        return self.is_testing_mode() or self.is_development_mode()
+        return self._is_testing or self._is_development
 
     def get_embedding_config(
         self, provider_name: str | None = None
     ) -> EmbeddingConfig | None:
         """Get the specified embedding provider config or the preferred one if not specified."""
-        if provider_name and provider_name in self.embedding_providers:
-            return self.embedding_providers[provider_name]
-        if (
-            self.preferred_embedding_provider
-            and self.preferred_embedding_provider in self.embedding_providers
-        ):
-            return self.embedding_providers[self.preferred_embedding_provider]
-        return None
+        if provider_name:
+            provider_config = self.embedding_providers.get(provider_name)
+            if provider_config is not None:
+                return provider_config
+        return self._default_embedding_config
+
+    # OAuth settings (loaded lazily from the config directory)
+
+    def _oauth_settings(
+        self,
+    ) -> tuple[dict[str, Any], str | None, int, bool, list[str]]:
+        if self._oauth is None:
+            oauth_data = (
+                _read_oauth_data(self.config_directory)
+                if self.config_directory
+                else None
+            )
+            self._oauth = (
+                _load_oauth_config(oauth_data)
+                if oauth_data is not None
+                else ({}, None, 86400, False, [])
+            )
+        return self._oauth
+
+    @property
+    def oauth_providers(self) -> dict[str, Any]:
+        return self._oauth_settings()[0]
+
+    @property
+    def oauth_session_secret(self) -> str | None:
+        return self._oauth_settings()[1]
+
+    @property
+    def oauth_token_expiration(self) -> int:
+        return self._oauth_settings()[2]
+
+    @property
+    def oauth_require_auth(self) -> bool:
+        return self._oauth_settings()[3]
+
+    @property
+    def oauth_anonymous_endpoints(self) -> list[str]:
+        return self._oauth_settings()[4]
 
     # Provider instance accessors (delegate to module-level ProviderMaps)
 
     def get_embedding_provider(self, name: str) -> EmbeddingProvider:
         """Get a cached embedding provider instance by name."""
-        if _embedding_provider_map is None:
-            raise RuntimeError(
-                "Providers not initialized. Call initialize_providers() first."
-            )
-        return _embedding_provider_map.get(name)
+        return _provider_maps["embedding"].get(name)
 
     def get_generative_provider(self, name: str) -> GenerativeLLMProvider:
         """Get a cached generative LLM provider instance by name."""
-        if _generative_provider_map is None:
-            raise RuntimeError(
-                "Providers not initialized. Call initialize_providers() first."
-            )
-        return _generative_provider_map.get(name)
+        return _provider_maps["generative"].get(name)
 
     def get_scoring_provider(self, name: str) -> ScoringLLMProvider:
         """Get a cached scoring LLM provider instance by name."""
-        if _scoring_provider_map is None:
-            raise RuntimeError(
-                "Providers not initialized. Call initialize_providers() first."
-            )
-        return _scoring_provider_map.get(name)
+        return _provider_maps["scoring"].get(name)
 
     def get_site_config_lookup(self, name: str) -> SiteConfigLookup:
         """Get a cached site config lookup instance by name."""
-        if _site_config_provider_map is None:
-            raise RuntimeError(
-                "Providers not initialized. Call initialize_providers() first."
-            )
-        return _site_config_provider_map.get(name)
+        return _provider_maps["site_config"].get(name)
 
     def get_object_lookup_provider(self, name: str) -> ObjectLookupProvider:
         """Get a cached object lookup provider instance by name."""
-        if _object_storage_provider_map is None:
-            raise RuntimeError(
-                "Providers not initialized. Call initialize_providers() first."
-            )
-        return _object_storage_provider_map.get(name)
+        return _provider_maps["object_storage"].get(name)
 
     def get_retrieval_provider(self, name: str) -> RetrievalProvider:
         """Get a cached retrieval provider instance by name."""
-        if _retrieval_provider_map is None:
-            raise RuntimeError(
-                "Providers not initialized. Call initialize_providers() first."
-            )
-        return _retrieval_provider_map.get(name)
+        return _provider_maps["retrieval"].get(name)
 
     def get_ranking_config(self) -> RankingConfig:
         """Get ranking config, checking for per-request override first."""
-        try:
-            return _ranking_config_override.get()
-        except LookupError:
-            return self._ranking or RankingConfig()
+        return _ranking_config_override.get() or self._ranking or RankingConfig()
 
 
 # =============================================================================
@@ -328,9 +406,19 @@ def _get_config_directory() -> str:
     Get the configuration directory from environment variable or use default.
     Default is the config folder at the same level as config.py.
     """
-    config_dir = os.getenv("NLWEB_CONFIG_DIR")
+    return _resolve_config_directory(os.getenv("NLWEB_CONFIG_DIR"))
+
+
+# The directory helpers only read an env var; the filesystem probes behind
+# them are cached per value so repeated config loads skip them.
+@lru_cache(maxsize=8)
+def _resolve_config_directory(config_dir: str | None) -> str:
     if config_dir:
-        config_dir = os.path.expanduser(os.path.expandvars(config_dir))
+        # Most deployments set a plain absolute path; skip expansion then
+        if "$" in config_dir:
+            config_dir = os.path.expandvars(config_dir)
+        if "~" in config_dir:
+            config_dir = os.path.expanduser(config_dir)
         if not os.path.exists(config_dir):
             print(
                 f"Warning: Configured config directory {config_dir} does not exist. Using default."
@@ -349,7 +437,11 @@ def _get_base_output_directory() -> str | None:
     Get the base directory for all output files from the environment variable.
     Returns None if the environment variable is not set.
     """
-    base_dir = os.getenv("NLWEB_OUTPUT_DIR")
+    return _ensure_base_output_directory(os.getenv("NLWEB_OUTPUT_DIR"))
+
+
+@lru_cache(maxsize=8)
+def _ensure_base_output_directory(base_dir: str | None) -> str | None:
     if base_dir and not os.path.exists(base_dir):
         try:
             os.makedirs(base_dir, exist_ok=True)
@@ -375,6 +467,28 @@ def _resolve_path(
         return os.path.abspath(os.path.join(config_directory, path))
 
 
+# Directories already created by _ensure_dir_once() in this process.
+_ENSURED_DIRS: set[str] = set()
+
+
+def _ensure_dir_once(path: str) -> None:
+    """Create path if needed, skipping the syscalls on later config loads."""
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+# Values that look like environment variable names (e.g. AZURE_OPENAI_KEY).
+# The match stops at the first character that cannot appear in such a name,
+# so ordinary values like model names or URLs are rejected almost immediately.
+_ENV_VAR_NAME = re.compile(r"[A-Z][A-Z0-9_]*")
+
+
+# Snapshot of os.environ, set only while load_config() is running so repeated
+# references to the same variable do not each go through os.environ.
+_env_snapshot: dict[str, str] | None = None
+
+
 def _get_config_value(value: Any, default: Any = None) -> Any:
     """
     Get configuration value. If value is an env var name, fetch from environment.
@@ -383,7 +497,9 @@ def _get_config_value(value: Any, default: Any = None) -> Any:
         return default
 
     if isinstance(value, str):
-        if value.endswith("_ENV") or value.isupper():
+        if value.endswith("_ENV") or _ENV_VAR_NAME.fullmatch(value):
+            if _env_snapshot is not None:
+                return _env_snapshot.get(value, default)
             return os.getenv(value, default)
         else:
             return value
@@ -391,6 +507,17 @@ def _get_config_value(value: Any, default: Any = None) -> Any:
     return value
 
 
+_MISSING = object()
+
+
+def _env_or_literal(cfg: dict, env_key: str, literal_key: str) -> Any:
+    """Resolve cfg[env_key] via _get_config_value if set, else cfg[literal_key]."""
+    value = cfg.get(env_key, _MISSING)
+    if value is _MISSING:
+        return cfg.get(literal_key)
+    return _get_config_value(value)
+
+
 # =============================================================================
 # Configuration Loading Functions
 # =============================================================================
@@ -412,13 +539,8 @@ def _load_embedding_config(
     for provider_name, provider_cfg in emb_cfg.items():
         if not isinstance(provider_cfg, dict):
             raise ValueError(f"embedding provider '{provider_name}' must be a mapping")
-        import_path, class_name = _extract_import_class(
-            provider_cfg, "embedding", provider_name
-        )
         providers[provider_name] = EmbeddingConfig(
-            import_path=import_path,
-            class_name=class_name,
-            options=_build_options(provider_cfg),
+            *_split_provider_cfg(provider_cfg, "embedding", provider_name)
         )
         if preferred is None:
             preferred = provider_name
@@ -438,13 +560,8 @@ def _load_retrieval_provider_config(data: dict) -> dict[str, RetrievalConfig]:
     for provider_name, provider_cfg in ret_cfg.items():
         if not isinstance(provider_cfg, dict):
             raise ValueError(f"retrieval provider '{provider_name}' must be a mapping")
-        import_path, class_name = _extract_import_class(
-            provider_cfg, "retrieval", provider_name
-        )
         providers[provider_name] = RetrievalConfig(
-            import_path=import_path,
-            class_name=class_name,
-            options=_build_options(provider_cfg),
+            *_split_provider_cfg(provider_cfg, "retrieval", provider_name)
         )
 
     return providers
@@ -468,27 +585,13 @@ def _load_conversation_storage(
     return ConversationStorageConfig(
         type=conv_cfg.get("type", "qdrant"),
         enabled=conv_cfg.get("enabled", True),
-        connection_string=(
-            _get_config_value(conv_cfg.get("connection_string_env"))
-            if "connection_string_env" in conv_cfg
-            else conv_cfg.get("connection_string")
+        connection_string=_env_or_literal(
+            conv_cfg, "connection_string_env", "connection_string"
         ),
         host=conv_cfg.get("account_name"),
-        url=(
-            _get_config_value(conv_cfg.get("url_env"))
-            if "url_env" in conv_cfg
-            else conv_cfg.get("url")
-        ),
-        endpoint=(
-            _get_config_value(conv_cfg.get("endpoint_env"))
-            if "endpoint_env" in conv_cfg
-            else conv_cfg.get("endpoint")
-        ),
-        api_key=(
-            _get_config_value(conv_cfg.get("api_key_env"))
-            if "api_key_env" in conv_cfg
-            else conv_cfg.get("api_key")
-        ),
+        url=_env_or_literal(conv_cfg, "url_env", "url"),
+        endpoint=_env_or_literal(conv_cfg, "endpoint_env", "endpoint"),
+        api_key=_env_or_literal(conv_cfg, "api_key_env", "api_key"),
         auth_method=conv_cfg.get("auth_method", "api_key"),
         table_name=conv_cfg.get("table_name"),
         database_path=(
@@ -502,6 +605,8 @@ def _load_conversation_storage(
         database_name=conv_cfg.get("database_name"),
         container_name=conv_cfg.get("container_name"),
         partition_key=conv_cfg.get("partition_key"),
+        pool_min_size=conv_cfg.get("pool_min_size", 5),
+        pool_max_size=conv_cfg.get("pool_max_size", 25),
     )
 
 
@@ -522,43 +627,39 @@ def _load_object_storage_config(data: dict) -> dict[str, ObjectStorageConfig]:
             raise ValueError(
                 f"object_storage provider '{provider_name}' must be a mapping"
             )
-        import_path, class_name = _extract_import_class(
-            provider_cfg, "object_storage", provider_name
-        )
         providers[provider_name] = ObjectStorageConfig(
-            import_path=import_path,
-            class_name=class_name,
-            options=_build_options(provider_cfg),
+            *_split_provider_cfg(provider_cfg, "object_storage", provider_name)
         )
 
     return providers
 
 
-def _extract_import_class(
+def _split_provider_cfg(
     provider_cfg: dict, config_name: str, provider_name: str
-) -> tuple[str, str]:
-    """Extract and validate import_path and class_name from provider config."""
+) -> tuple[str, str, dict[str, Any]]:
+    """
+    Split a provider config into (import_path, class_name, options) in one pass.
+
+    Keys ending in _env are resolved from the environment and stored under the
+    key without the suffix.
+    """
     import_path = provider_cfg.get("import_path")
     class_name = provider_cfg.get("class_name")
     if not import_path or not class_name:
         raise ValueError(
             f"{config_name} provider '{provider_name}' must specify import_path and class_name"
         )
-    return import_path, class_name
-
 
-def _build_options(provider_cfg: dict) -> dict[str, Any]:
-    """Build options dict from provider config, resolving _env suffixed keys."""
+    resolve = _get_config_value
     options: dict[str, Any] = {}
     for key, value in provider_cfg.items():
-        if key in ("import_path", "class_name"):
+        if key == "import_path" or key == "class_name":
             continue
         if key.endswith("_env"):
-            resolved_key = key[:-4]  # Remove _env suffix
-            options[resolved_key] = _get_config_value(value)
+            options[key[:-4]] = resolve(value)
         else:
             options[key] = value
-    return options
+    return import_path, class_name, options
 
 
 def _load_site_config_storage(data: dict) -> dict[str, SiteConfigStorageConfig]:
@@ -576,13 +677,8 @@ def _load_site_config_storage(data: dict) -> dict[str, SiteConfigStorageConfig]:
             raise ValueError(
                 f"site_config provider '{provider_name}' must be a mapping"
             )
-        import_path, class_name = _extract_import_class(
-            provider_cfg, "site_config", provider_name
-        )
         providers[provider_name] = SiteConfigStorageConfig(
-            import_path=import_path,
-            class_name=class_name,
-            options=_build_options(provider_cfg),
+            *_split_provider_cfg(provider_cfg, "site_config", provider_name)
         )
 
     return providers
@@ -603,13 +699,8 @@ def _load_scoring_model_config(data: dict) -> dict[str, ScoringModelConfig]:
             raise ValueError(
                 f"scoring_model provider '{provider_name}' must be a mapping"
             )
-        import_path, class_name = _extract_import_class(
-            provider_cfg, "scoring_model", provider_name
-        )
         providers[provider_name] = ScoringModelConfig(
-            import_path=import_path,
-            class_name=class_name,
-            options=_build_options(provider_cfg),
+            *_split_provider_cfg(provider_cfg, "scoring_model", provider_name)
         )
 
     return providers
@@ -632,18 +723,16 @@ def _load_generative_model_config(data: dict) -> dict[str, GenerativeModelConfig
             raise ValueError(
                 f"generative_model provider '{provider_name}' must be a mapping"
             )
-        import_path, class_name = _extract_import_class(
-            provider_cfg, "generative_model", provider_name
-        )
         providers[provider_name] = GenerativeModelConfig(
-            import_path=import_path,
-            class_name=class_name,
-            options=_build_options(provider_cfg),
+            *_split_provider_cfg(provider_cfg, "generative_model", provider_name)
         )
 
     return providers
 
 
+_RANKING_STRATEGIES = ("per_item", "batch")
+
+
 def _load_ranking_config(data: dict) -> RankingConfig:
     """Load ranking configuration from config dict."""
     if "ranking_config" not in data:
@@ -654,8 +743,15 @@ def _load_ranking_config(data: dict) -> RankingConfig:
         "scoring_questions",
         ["Is this item relevant to the query?"],
     )
+    strategy = ranking_cfg.get("strategy", "per_item")
+    if strategy not in _RANKING_STRATEGIES:
+        raise ValueError(
+            f"ranking_config.strategy must be one of {_RANKING_STRATEGIES}, "
+            f"got '{strategy}'"
+        )
     return RankingConfig(
         scoring_questions=scoring_questions,
+        strategy=strategy,
     )
 
 
@@ -675,10 +771,14 @@ def _load_nlweb_config(
     data: dict, config_directory: str, base_output_directory: str | None
 ) -> NLWebConfig:
     """Load NLWeb configuration from config dict."""
+    # Local aliases: this function does a dozen lookups of each
+    get = data.get
+    resolve = _get_config_value
+
     # Parse sites
-    sites_str = _get_config_value(data.get("sites"), "")
+    sites_str = resolve(get("sites"), "")
     sites_list = (
-        [site.strip() for site in sites_str.split(",") if site.strip()]
+        [site for site in (token.strip() for token in sites_str.split(",")) if site]
         if sites_str
         else []
     )
@@ -687,66 +787,60 @@ def _load_nlweb_config(
     json_data_folder = "./data/json"
     json_with_embeddings_folder = "./data/json_with_embeddings"
 
-    if "data_folders" in data:
-        json_data_folder = _get_config_value(
-            data["data_folders"].get("json_data"), json_data_folder
-        )
-        json_with_embeddings_folder = _get_config_value(
-            data["data_folders"].get("json_with_embeddings"),
+    data_folders = get("data_folders")
+    if data_folders is not None:
+        json_data_folder = resolve(data_folders.get("json_data"), json_data_folder)
+        json_with_embeddings_folder = resolve(
+            data_folders.get("json_with_embeddings"),
             json_with_embeddings_folder,
         )
 
     # Resolve paths
     if base_output_directory:
+        data_dir = os.path.join(base_output_directory, "data")
         if not os.path.isabs(json_data_folder):
-            json_data_folder = os.path.join(base_output_directory, "data", "json")
+            json_data_folder = os.path.join(data_dir, "json")
         if not os.path.isabs(json_with_embeddings_folder):
-            json_with_embeddings_folder = os.path.join(
-                base_output_directory, "data", "json_with_embeddings"
-            )
+            json_with_embeddings_folder = os.path.join(data_dir, "json_with_embeddings")
 
     # Ensure directories exist
-    os.makedirs(json_data_folder, exist_ok=True)
-    os.makedirs(json_with_embeddings_folder, exist_ok=True)
-
-    # Load API keys
-    api_keys = {}
-    if "api_keys" in data:
-        for key, value in data["api_keys"].items():
-            resolved_value = _get_config_value(value)
-            api_keys[key] = resolved_value
-            logger.info(
-                "Loaded API key value: %s", "set" if resolved_value else "not set"
-            )
+    _ensure_dir_once(json_data_folder)
+    _ensure_dir_once(json_with_embeddings_folder)
+
+    # Load API keys (resolved against the env snapshot taken by load_config)
+    api_keys = {key: resolve(value) for key, value in get("api_keys", {}).items()}
+    if api_keys:
+        logger.info(
+            "Loaded %d API key values (%d set)",
+            len(api_keys),
+            sum(1 for value in api_keys.values() if value),
+        )
 
     return NLWebConfig(
         sites=sites_list,
         json_data_folder=json_data_folder,
         json_with_embeddings_folder=json_with_embeddings_folder,
-        chatbot_instructions=data.get("chatbot_instructions", {}),
-        headers=data.get("headers", {}),
-        tool_selection_enabled=_get_config_value(
-            data.get("tool_selection_enabled"), True
+        chatbot_instructions=get("chatbot_instructions", {}),
+        headers=get("headers", {}),
+        tool_selection_enabled=resolve(get("tool_selection_enabled"), True),
+        memory_enabled=resolve(get("memory_enabled"), False),
+        analyze_query_enabled=resolve(get("analyze_query_enabled"), False),
+        decontextualize_enabled=resolve(get("decontextualize_enabled"), True),
+        required_info_enabled=resolve(get("required_info_enabled"), True),
+        speculative_retrieval_enabled=resolve(
+            get("speculative_retrieval_enabled"), True
         ),
-        memory_enabled=_get_config_value(data.get("memory_enabled"), False),
-        analyze_query_enabled=_get_config_value(
-            data.get("analyze_query_enabled"), False
-        ),
-        decontextualize_enabled=_get_config_value(
-            data.get("decontextualize_enabled"), True
-        ),
-        required_info_enabled=_get_config_value(
-            data.get("required_info_enabled"), True
-        ),
-        aggregation_enabled=_get_config_value(data.get("aggregation_enabled"), False),
-        who_endpoint_enabled=_get_config_value(data.get("who_endpoint_enabled"), True),
+        aggregation_enabled=resolve(get("aggregation_enabled"), False),
+        who_endpoint_enabled=resolve(get("who_endpoint_enabled"), True),
         api_keys=api_keys,
-        who_endpoint=_get_config_value(
-            data.get("who_endpoint"), "http://localhost:8000/who"
-        ),
+        who_endpoint=resolve(get("who_endpoint"), "http://localhost:8000/who"),
     )
 
 
+# Provider settings copied as-is from config_oauth.yaml
+_OAUTH_PROVIDER_KEYS = ("auth_url", "token_url", "userinfo_url", "emails_url", "scope")
+
+
 def _load_oauth_config(
     data: dict,
 ) -> tuple[dict[str, Any], str | None, int, bool, list[str]]:
@@ -759,20 +853,15 @@ def _load_oauth_config(
 
     # Load providers
     for provider_name, provider_data in data.get("providers", {}).items():
-        if provider_data.get("enabled", False):
-            client_id = _get_config_value(provider_data.get("client_id_env"))
-            client_secret = _get_config_value(provider_data.get("client_secret_env"))
-
-            if client_id and client_secret:
-                oauth_providers[provider_name] = {
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                    "auth_url": provider_data.get("auth_url"),
-                    "token_url": provider_data.get("token_url"),
-                    "userinfo_url": provider_data.get("userinfo_url"),
-                    "emails_url": provider_data.get("emails_url"),
-                    "scope": provider_data.get("scope"),
-                }
+        if not provider_data.get("enabled", False):
+            continue
+        client_id = _get_config_value(provider_data.get("client_id_env"))
+        client_secret = _get_config_value(provider_data.get("client_secret_env"))
+        if client_id and client_secret:
+            oauth_providers[provider_name] = {
+                "client_id": client_id,
+                "client_secret": client_secret,
+            } | {key: provider_data.get(key) for key in _OAUTH_PROVIDER_KEYS}
 
     # Session config
     session_config = data.get("session", {})
@@ -797,6 +886,95 @@ def _load_oauth_config(
     )
 
 
+def _parsed_yaml_cache_path(raw: bytes) -> str | None:
+    """
+    Return the parsed-YAML cache file for the given file contents, or None if
+    caching is disabled.
+
+    Enabled with NLWEB_CONFIG_CACHE=1. Only the parsed YAML document is cached,
+    not the AppConfig: environment variables are still resolved on every load,
+    so secrets never end up on disk and env changes take effect immediately.
+    """
+    if os.getenv("NLWEB_CONFIG_CACHE") != "1":
+        return None
+    cache_root = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return os.path.join(cache_root, "nlweb", f"config-{digest}.pkl")
+
+
+# path -> ((st_mtime_ns, st_size), pickled parse). Re-running load_config() in
+# the same process (tests, re-initialization) skips YAML for unchanged files.
+# The parse is stored pickled so every caller gets its own fresh objects.
+_parsed_yaml_memo: dict[str, tuple[tuple[int, int], bytes]] = {}
+
+
+def _read_yaml_file(path: str) -> dict:
+    """Parse a YAML config file, reusing an earlier parse if it is unchanged."""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    memo = _parsed_yaml_memo.get(path)
+    if memo is not None and memo[0] == stamp:
+        return pickle.loads(memo[1])
+
+    data = _parse_yaml_file(path)
+    _parsed_yaml_memo[path] = (stamp, pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+    return data
+
+
+def _parse_yaml_file(path: str) -> dict:
+    """Parse a YAML config file, reusing a cached parse when enabled."""
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    cache_path = _parsed_yaml_cache_path(raw)
+    if cache_path is not None:
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning(f"Ignoring unreadable config cache {cache_path}: {e}")
+
+    import yaml
+
+    # libyaml's C loader when PyYAML was built with it; same semantics as safe_load
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(raw, Loader=loader) or {}
+
+    if cache_path is not None:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write config cache {cache_path}: {e}")
+
+    return data
+
+
+def _read_oauth_data(config_directory: str) -> dict | None:
+    """
+    Read raw OAuth config data, or None if no OAuth config file exists.
+
+    The OAuth config is flat key/value data, so a config_oauth.json placed next
+    to config_oauth.yaml is preferred when present; it parses much faster than
+    YAML.
+    """
+    oauth_json_path = os.path.join(config_directory, "config_oauth.json")
+    if os.path.exists(oauth_json_path):
+        with open(oauth_json_path, "rb") as f:
+            return json.load(f) or {}
+
+    oauth_path = os.path.join(config_directory, "config_oauth.yaml")
+    if os.path.exists(oauth_path):
+        return _read_yaml_file(oauth_path)
+
+    return None
+
+
 # =============================================================================
 # Main Configuration Loading Function
 # =============================================================================
@@ -807,10 +985,25 @@ def load_config() -> AppConfig:
     Load configuration from files and return an AppConfig instance.
 
     This function reads YAML and XML configuration files and constructs
-    a fully populated AppConfig dataclass.
+    a fully populated AppConfig dataclass. Environment variables referenced
+    by the config are resolved against a single snapshot of os.environ taken
+    after .env is loaded.
     """
+    global _env_snapshot
+    # Deferred import: only needed when actually loading config files
+    from dotenv import load_dotenv
+
     load_dotenv()
 
+    _env_snapshot = dict(os.environ)
+    try:
+        return _load_app_config()
+    finally:
+        _env_snapshot = None
+
+
+def _load_app_config() -> AppConfig:
+    """Build the AppConfig from the config directory. Called by load_config()."""
     config_directory = _get_config_directory()
     base_output_directory = _get_base_output_directory()
 
@@ -818,8 +1011,7 @@ def load_config() -> AppConfig:
     unified_config_path = os.path.join(config_directory, "config.yaml")
 
     if os.path.exists(unified_config_path):
-        with open(unified_config_path, "r") as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_yaml_file(unified_config_path)
 
         # Load all configurations from unified file
         generative_model_providers = _load_generative_model_config(data)
@@ -835,53 +1027,29 @@ def load_config() -> AppConfig:
         server = _load_server_config(data)
         nlweb = _load_nlweb_config(data, config_directory, base_output_directory)
 
-        # OAuth from separate file or defaults
-        oauth_path = os.path.join(config_directory, "config_oauth.yaml")
-        if os.path.exists(oauth_path):
-            with open(oauth_path, "r") as f:
-                oauth_data = yaml.safe_load(f) or {}
-            (
-                oauth_providers,
-                oauth_session_secret,
-                oauth_token_expiration,
-                oauth_require_auth,
-                oauth_anonymous_endpoints,
-            ) = _load_oauth_config(oauth_data)
-        else:
-            (
-                oauth_providers,
-                oauth_session_secret,
-                oauth_token_expiration,
-                oauth_require_auth,
-                oauth_anonymous_endpoints,
-            ) = ({}, None, 86400, False, [])
-
+        # Positional in AppConfig field order. OAuth settings are loaded
+        # lazily by AppConfig from config_directory.
         return AppConfig(
-            config_directory=config_directory,
-            base_output_directory=base_output_directory,
-            generative_model_providers=generative_model_providers,
-            embedding_providers=embedding_providers,
-            preferred_embedding_provider=preferred_embedding_provider,
-            retrieval_providers=retrieval_providers,
-            conversation_storage=conversation_storage,
-            conversation_storage_behavior=StorageBehaviorConfig(),
-            conversation_storage_endpoints={},
-            conversation_storage_default="qdrant_local",
-            object_storage_providers=object_storage_providers,
-            site_config_providers=site_config_providers,
-            scoring_model_providers=scoring_model_providers,
-            _ranking=ranking,
-            nlweb=nlweb,
-            server=server,
-            port=data.get("port", 8080),
-            mode=data.get("mode", "production"),
-            nlweb_gateway=data.get("nlweb_gateway", "nlwm.azurewebsites.net"),
-            test_user=os.getenv("TEST_USER", "anonymous"),
-            oauth_providers=oauth_providers,
-            oauth_session_secret=oauth_session_secret,
-            oauth_token_expiration=oauth_token_expiration,
-            oauth_require_auth=oauth_require_auth,
-            oauth_anonymous_endpoints=oauth_anonymous_endpoints,
+            config_directory,
+            base_output_directory,
+            generative_model_providers,
+            embedding_providers,
+            preferred_embedding_provider,
+            retrieval_providers,
+            conversation_storage,
+            StorageBehaviorConfig(),
+            {},  # conversation_storage_endpoints
+            "qdrant_local",  # conversation_storage_default
+            object_storage_providers,
+            site_config_providers,
+            scoring_model_providers,
+            ranking,
+            nlweb,
+            server,
+            data.get("port", 8080),
+            data.get("mode", "production"),
+            data.get("nlweb_gateway", "nlwm.azurewebsites.net"),
+            os.getenv("TEST_USER", "anonymous"),
         )
 
     # No config file - return defaults
@@ -904,9 +1072,9 @@ def load_config() -> AppConfig:
 # Module-private static config - None until initialize_config() is called
 _STATIC_CONFIG: AppConfig | None = None
 
-# Per-request ranking config override (no default - falls back to static config)
-_ranking_config_override: ContextVar[RankingConfig] = ContextVar(
-    "ranking_config_override"
+# Per-request ranking config override (None falls back to static config)
+_ranking_config_override: ContextVar[RankingConfig | None] = ContextVar(
+    "ranking_config_override", default=None
 )
 
 
@@ -951,126 +1119,95 @@ def override_ranking_config(ranking_config: RankingConfig):
 # Provider Maps (module-level, initialized by initialize_providers() at startup)
 # =============================================================================
 
-_embedding_provider_map: ProviderMap | None = None
-_generative_provider_map: ProviderMap | None = None
-_scoring_provider_map: ProviderMap | None = None
-_site_config_provider_map: ProviderMap | None = None
-_object_storage_provider_map: ProviderMap | None = None
-_retrieval_provider_map: ProviderMap | None = None
 
+class _UninitializedProviderMap:
+    """
+    Placeholder for provider maps before initialize_providers() runs.
 
-@contextmanager
-def override_embedding_provider(old_name: str, new_name: str):
-    """Temporarily remap an embedding provider name."""
-    if _embedding_provider_map is None:
-        raise RuntimeError(
-            "Providers not initialized. Call initialize_providers() first."
-        )
-    with _embedding_provider_map.override(old_name, new_name):
-        yield
-
+    Lookups and overrides raise, so accessors can call the map directly
+    without checking for None on every request.
+    """
 
-@contextmanager
-def override_generative_provider(old_name: str, new_name: str):
-    """Temporarily remap a generative provider name."""
-    if _generative_provider_map is None:
+    def get(self, name: str) -> Any:
         raise RuntimeError(
             "Providers not initialized. Call initialize_providers() first."
         )
-    with _generative_provider_map.override(old_name, new_name):
-        yield
 
-
-@contextmanager
-def override_scoring_provider(old_name: str, new_name: str):
-    """Temporarily remap a scoring provider name."""
-    if _scoring_provider_map is None:
+    def override(self, old_name: str, new_name: str) -> Any:
         raise RuntimeError(
             "Providers not initialized. Call initialize_providers() first."
         )
-    with _scoring_provider_map.override(old_name, new_name):
-        yield
 
-
-@contextmanager
-def override_site_config_provider(old_name: str, new_name: str):
-    """Temporarily remap a site config provider name."""
-    if _site_config_provider_map is None:
-        raise RuntimeError(
-            "Providers not initialized. Call initialize_providers() first."
-        )
-    with _site_config_provider_map.override(old_name, new_name):
-        yield
+    async def close(self) -> None:
+        pass
+
+
+_UNINITIALIZED = _UninitializedProviderMap()
+
+# Provider maps keyed by kind: "embedding", "generative", "scoring",
+# "site_config", "object_storage", "retrieval".
+#
+# The registry is written once by initialize_providers() at startup and only
+# read afterwards, so it is a plain dict rather than a ContextVar (a ContextVar
+# set inside the startup hook would not be visible to request tasks). Name
+# overrides are task-local because each ProviderMap keeps them in its own
+# ContextVar, so an override in one request never leaks into another.
+_provider_maps: dict[str, ProviderMap | _UninitializedProviderMap] = dict.fromkeys(
+    (
+        "embedding",
+        "generative",
+        "scoring",
+        "site_config",
+        "object_storage",
+        "retrieval",
+    ),
+    _UNINITIALIZED,
+)
 
 
-@contextmanager
-def override_object_storage_provider(old_name: str, new_name: str):
-    """Temporarily remap an object storage provider name."""
-    if _object_storage_provider_map is None:
-        raise RuntimeError(
-            "Providers not initialized. Call initialize_providers() first."
-        )
-    with _object_storage_provider_map.override(old_name, new_name):
-        yield
+def _override_provider(kind: str, old_name: str, new_name: str) -> NameOverride:
+    """Temporarily remap a provider name within the given provider kind."""
+    return _provider_maps[kind].override(old_name, new_name)
 
 
-@contextmanager
-def override_retrieval_provider(old_name: str, new_name: str):
-    """Temporarily remap a retrieval provider name."""
-    if _retrieval_provider_map is None:
-        raise RuntimeError(
-            "Providers not initialized. Call initialize_providers() first."
-        )
-    with _retrieval_provider_map.override(old_name, new_name):
-        yield
+override_embedding_provider = partial(_override_provider, "embedding")
+override_generative_provider = partial(_override_provider, "generative")
+override_scoring_provider = partial(_override_provider, "scoring")
+override_site_config_provider = partial(_override_provider, "site_config")
+override_object_storage_provider = partial(_override_provider, "object_storage")
+override_retrieval_provider = partial(_override_provider, "retrieval")
 
 
 def initialize_providers(config: AppConfig) -> None:
-    """Eagerly create all provider instances from config. Call at server startup."""
-    global \
-        _embedding_provider_map, \
-        _generative_provider_map, \
-        _scoring_provider_map, \
-        _site_config_provider_map, \
-        _object_storage_provider_map, \
-        _retrieval_provider_map
-    _embedding_provider_map = ProviderMap(
-        config=config.embedding_providers,
-        error_prefix="Embedding provider",
-    )
-    _generative_provider_map = ProviderMap(
-        config=config.generative_model_providers,
-        error_prefix="Generative model provider",
-    )
-    _scoring_provider_map = ProviderMap(
-        config=config.scoring_model_providers,
-        error_prefix="Scoring model provider",
-    )
-    _site_config_provider_map = ProviderMap(
-        config=config.site_config_providers,
-        error_prefix="Site config provider",
-    )
-    _object_storage_provider_map = ProviderMap(
-        config=config.object_storage_providers,
-        error_prefix="Object storage provider",
-    )
-    _retrieval_provider_map = ProviderMap(
-        config=config.retrieval_providers,
-        error_prefix="Retrieval provider",
-    )
+    """
+    Eagerly create all provider instances from config. Call at server startup.
+
+    The maps are built on worker threads so provider module imports and
+    client construction overlap. The registry is only updated once every map
+    has loaded; the first failure is raised and nothing is installed.
+    """
+    specs = {
+        "embedding": (config.embedding_providers, "Embedding provider"),
+        "generative": (config.generative_model_providers, "Generative model provider"),
+        "scoring": (config.scoring_model_providers, "Scoring model provider"),
+        "site_config": (config.site_config_providers, "Site config provider"),
+        "object_storage": (config.object_storage_providers, "Object storage provider"),
+        "retrieval": (config.retrieval_providers, "Retrieval provider"),
+    }
+    with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+        futures = {
+            kind: executor.submit(ProviderMap, config=cfg, error_prefix=prefix)
+            for kind, (cfg, prefix) in specs.items()
+        }
+    _provider_maps.update({kind: future.result() for kind, future in futures.items()})
 
 
 async def close_all_providers() -> None:
-    """Close all cached provider instances. Call at server shutdown."""
-    if _embedding_provider_map is not None:
-        await _embedding_provider_map.close()
-    if _generative_provider_map is not None:
-        await _generative_provider_map.close()
-    if _scoring_provider_map is not None:
-        await _scoring_provider_map.close()
-    if _site_config_provider_map is not None:
-        await _site_config_provider_map.close()
-    if _object_storage_provider_map is not None:
-        await _object_storage_provider_map.close()
-    if _retrieval_provider_map is not None:
-        await _retrieval_provider_map.close()
+    """Close all cached provider instances concurrently. Call at server shutdown."""
+    results = await asyncio.gather(
+        *(provider_map.close() for provider_map in _provider_maps.values()),
+        return_exceptions=True,
+    )
+    for kind, result in zip(_provider_maps, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Error closing {kind} providers: {result}")
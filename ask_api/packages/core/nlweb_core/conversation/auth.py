@@ -8,13 +8,73 @@ Handles user ID extraction and conversation access validation.
 """
 
 import logging
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+from weakref import WeakKeyDictionary
 
-from nlweb_core.conversation.storage import ConversationStorageClient
 from nlweb_core.protocol.models import Meta
 
+if TYPE_CHECKING:
+    # storage imports this module to invalidate cached owners on delete
+    from nlweb_core.conversation.storage import ConversationStorageClient
+
 logger = logging.getLogger(__name__)
 
+# Escape CR/LF in user-provided values before logging to prevent log injection.
+_LOG_ESCAPES = str.maketrans({"\n": "\\n", "\r": "\\r"})
+
+
+def _sanitize_for_log(value: str) -> str:
+    """Escape newlines in a user-provided value so it stays on one log line."""
+    return value.translate(_LOG_ESCAPES)
+
+
+# A conversation's owner only changes if it is deleted and its ID reused, so
+# recent lookups are cached to spare a storage round-trip on every request
+# against the same conversation; ConversationStorageClient.delete_conversation
+# drops the entry through invalidate_conversation_owner. Only found owners are
+# cached: a miss may be a conversation whose first message has not been
+# stored yet. Caches are kept per storage client, since the same conversation
+# ID can belong to different users in different stores.
+_OWNER_TTL = 60.0
+_OWNER_CACHE_MAX_SIZE = 10_000
+_OwnerCache = OrderedDict[str, tuple[str, float]]
+_OWNER_CACHES: "WeakKeyDictionary[ConversationStorageClient, _OwnerCache]" = (
+    WeakKeyDictionary()
+)
+
+
+def invalidate_conversation_owner(
+    storage: "ConversationStorageClient", conversation_id: str
+) -> None:
+    """Forget a conversation's cached owner, e.g. after it is deleted."""
+    cache = _OWNER_CACHES.get(storage)
+    if cache is not None:
+        cache.pop(conversation_id, None)
+
+
+async def _get_conversation_owner(
+    conversation_id: str, storage: "ConversationStorageClient"
+) -> Optional[str]:
+    """Get a conversation's owner, using the TTL cache when possible."""
+    cache = _OWNER_CACHES.get(storage)
+    if cache is None:
+        cache = _OWNER_CACHES[storage] = _OwnerCache()
+
+    now = time.monotonic()
+    entry = cache.get(conversation_id)
+    if entry is not None and entry[1] > now:
+        return entry[0]
+
+    owner = await storage.get_conversation_owner(conversation_id)
+    if owner:
+        cache[conversation_id] = (owner, now + _OWNER_TTL)
+        cache.move_to_end(conversation_id)
+        if len(cache) > _OWNER_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+    return owner
+
 
 def get_authenticated_user_id(request_meta: Optional[Meta]) -> Optional[str]:
     """
@@ -29,24 +89,22 @@ def get_authenticated_user_id(request_meta: Optional[Meta]) -> Optional[str]:
     Returns:
         User ID string, or None if not found
     """
-    if not request_meta or not request_meta.user:
+    user = request_meta.user if request_meta else None
+    if not user:
         return None
 
     # Handle dict format
-    if isinstance(request_meta.user, dict):
-        return request_meta.user.get("id") or request_meta.user.get("user_id")
+    if isinstance(user, dict):
+        return user.get("id") or user.get("user_id")
 
     # Handle object format
-    if hasattr(request_meta.user, "id"):
-        return request_meta.user.id
-    if hasattr(request_meta.user, "user_id"):
-        return request_meta.user.user_id
-
-    return None
+    return getattr(user, "id", None) or getattr(user, "user_id", None)
 
 
 async def validate_conversation_access(
-    conversation_id: str, authenticated_user_id: str, storage: ConversationStorageClient
+    conversation_id: str,
+    authenticated_user_id: str,
+    storage: "ConversationStorageClient",
 ) -> bool:
     """
     Verify that the authenticated user owns this conversation.
@@ -60,49 +118,24 @@ async def validate_conversation_access(
         True if user has access, False otherwise
     """
     try:
-        # Get first message to check ownership
-        messages = await storage.get_messages(conversation_id, limit=1)
-
-        if not messages:
-            # Sanitize conversation_id for logging to prevent log injection
-            sanitized_conv_id = conversation_id.replace("\n", "\\n").replace(
-                "\r", "\\r"
-            )
-            logger.warning(f"Conversation {sanitized_conv_id} not found")
-            return False
-
-        # Extract user_id from message metadata
-        message_user_id = (
-            messages[0].metadata.get("user_id") if messages[0].metadata else None
-        )
+        # Fetch only the owner rather than a full message
+        message_user_id = await _get_conversation_owner(conversation_id, storage)
 
         if not message_user_id:
-            # Sanitize conversation_id for logging to prevent log injection
-            sanitized_conv_id = conversation_id.replace("\n", "\\n").replace(
-                "\r", "\\r"
-            )
             logger.warning(
-                f"Conversation {sanitized_conv_id} has no user_id in metadata"
+                f"Conversation {_sanitize_for_log(conversation_id)} "
+                "not found or has no user_id"
             )
             return False
 
         # Check if user_id matches
         has_access = message_user_id == authenticated_user_id
 
-        if not has_access:
-            # Sanitize all user-provided values for logging to prevent log injection
-            sanitized_auth_user = authenticated_user_id.replace("\n", "\\n").replace(
-                "\r", "\\r"
-            )
-            sanitized_conv_id = conversation_id.replace("\n", "\\n").replace(
-                "\r", "\\r"
-            )
-            sanitized_msg_user = message_user_id.replace("\n", "\\n").replace(
-                "\r", "\\r"
-            )
+        if not has_access and logger.isEnabledFor(logging.WARNING):
             logger.warning(
-                f"Access denied: user {sanitized_auth_user} tried to access "
-                f"conversation {sanitized_conv_id} owned by {sanitized_msg_user}"
+                f"Access denied: user {_sanitize_for_log(authenticated_user_id)} "
+                f"tried to access conversation {_sanitize_for_log(conversation_id)} "
+                f"owned by {_sanitize_for_log(message_user_id)}"
             )
 
         return has_access
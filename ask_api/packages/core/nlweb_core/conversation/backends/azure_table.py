@@ -8,12 +8,17 @@ WARNING: This code is under development and may undergo changes in future releas
 Backwards compatibility is not guaranteed at this time.
 """
 
+import asyncio
 import json
+from collections import OrderedDict
 from datetime import datetime
-from typing import List
+from typing import List, Optional
+
+from pydantic import TypeAdapter
 
 from nlweb_core.conversation.models import ConversationMessage
 from nlweb_core.conversation.storage import ConversationStorageInterface
+from nlweb_core.protocol.models import AskRequest, ResultObject
 
 # Lazy imports to avoid requiring azure.data.tables when not using this backend
 _azure_imports_done = False
@@ -21,12 +26,26 @@ TableServiceClient = None
 TableClient = None
 ResourceExistsError = None
 ResourceNotFoundError = None
+TableTransactionError = None
+
+# Validates/serializes a whole results list in one pydantic-core pass
+_results_adapter = TypeAdapter(List[ResultObject])
+
+# Azure Table entity group transactions are limited to 100 operations
+_TRANSACTION_BATCH_SIZE = 100
+
+# Upper bound on delete requests in flight at once
+_MAX_CONCURRENT_DELETES = 16
+
+# Most recently written conversations remembered as already indexed; older
+# ones just try to create their index entity again, which is harmless
+_INDEXED_CONVERSATIONS_MAX_SIZE = 10_000
 
 
 def _ensure_azure_imports():
     """Import Azure dependencies only when needed."""
     global _azure_imports_done, TableServiceClient, TableClient
-    global ResourceExistsError, ResourceNotFoundError
+    global ResourceExistsError, ResourceNotFoundError, TableTransactionError
 
     if not _azure_imports_done:
         from azure.core.exceptions import (
@@ -35,6 +54,7 @@ def _ensure_azure_imports():
         from azure.core.exceptions import (
             ResourceNotFoundError as RNFE,
         )
+        from azure.data.tables import TableTransactionError as TTE
         from azure.data.tables.aio import TableClient as TC
         from azure.data.tables.aio import TableServiceClient as TSC
 
@@ -42,6 +62,7 @@ def _ensure_azure_imports():
         TableClient = TC
         ResourceExistsError = REE
         ResourceNotFoundError = RNFE
+        TableTransactionError = TTE
         _azure_imports_done = True
 
 
@@ -53,11 +74,19 @@ class AzureTableStorage(ConversationStorageInterface):
     - PartitionKey: user_id (enables fast queries for all user conversations)
     - RowKey: conversation_id_timestamp (enables ordering and uniqueness)
 
+    Each conversation also has an index entity (PartitionKey
+    "conv:<conversation_id>", RowKey "meta") recording its owner, so reads
+    by conversation_id can target the owner's partition instead of scanning
+    the whole table.
+
     This allows efficient queries for:
     - All conversations for a user
+    - All messages in a conversation, in timestamp order
     - Filtering by site in application code
     """
 
+    accepts_raw_results = True
+
     def __init__(self, config):
         """
         Initialize Azure Table Storage.
@@ -74,6 +103,8 @@ class AzureTableStorage(ConversationStorageInterface):
         self.table_client = None
         self._table_initialized = False
         self._client_initialized = False
+        # Conversations whose index entity this process has already written
+        self._indexed_conversations: OrderedDict[str, None] = OrderedDict()
 
         # Validate configuration
         if not config.connection_string and not (
@@ -123,6 +154,30 @@ class AzureTableStorage(ConversationStorageInterface):
 
         self._table_initialized = True
 
+    async def initialize(self) -> None:
+        """Create the client and the table up front."""
+        await self._ensure_table_exists()
+
+    async def close(self) -> None:
+        """Close the table clients and their HTTP sessions."""
+        if not self._client_initialized:
+            return
+        await self.table_client.close()
+        await self.table_service_client.close()
+        self.table_client = None
+        self.table_service_client = None
+        self._client_initialized = False
+        self._table_initialized = False
+
+    @staticmethod
+    def _dump_results(results) -> Optional[str]:
+        """Serialize results, which may be raw dicts or ResultObject models."""
+        if not results:
+            return None
+        if isinstance(results[0], dict):
+            return json.dumps(results)
+        return _results_adapter.dump_json(results).decode()
+
     def _message_to_entity(self, message: ConversationMessage) -> dict:
         """
         Convert ConversationMessage to Azure Table entity.
@@ -136,8 +191,13 @@ class AzureTableStorage(ConversationStorageInterface):
             else "anonymous"
         )
 
-        # Create RowKey with timestamp for ordering
-        timestamp_str = message.timestamp.strftime("%Y%m%d%H%M%S%f")
+        # Create RowKey with timestamp for ordering; equivalent to
+        # strftime("%Y%m%d%H%M%S%f") without the format-string parsing
+        ts = message.timestamp
+        timestamp_str = (
+            f"{ts.year:04d}{ts.month:02d}{ts.day:02d}"
+            f"{ts.hour:02d}{ts.minute:02d}{ts.second:02d}{ts.microsecond:06d}"
+        )
         row_key = f"{message.conversation_id}_{timestamp_str}"
 
         # Serialize request and results to JSON
@@ -147,10 +207,8 @@ class AzureTableStorage(ConversationStorageInterface):
             "message_id": message.message_id,
             "conversation_id": message.conversation_id,
             "timestamp": message.timestamp.isoformat(),
-            "request": json.dumps(message.request.model_dump(mode="json")),
-            "results": json.dumps([r.model_dump(mode="json") for r in message.results])
-            if message.results
-            else None,
+            "request": message.request.model_dump_json(),
+            "results": self._dump_results(message.results),
             "metadata": json.dumps(message.metadata) if message.metadata else None,
             "site": message.metadata.get("site")
             if message.metadata
@@ -161,16 +219,12 @@ class AzureTableStorage(ConversationStorageInterface):
 
     def _entity_to_message(self, entity: dict) -> ConversationMessage:
         """Convert Azure Table entity to ConversationMessage."""
-        from nlweb_core.protocol.models import AskRequest, ResultObject
-
-        # Parse JSON fields
-        request_data = json.loads(entity["request"])
-        request = AskRequest(**request_data)
+        # Validate the JSON fields directly, without building dicts first
+        request = AskRequest.model_validate_json(entity["request"])
 
         results = None
         if entity.get("results"):
-            results_data = json.loads(entity["results"])
-            results = [ResultObject(**r) for r in results_data]
+            results = _results_adapter.validate_json(entity["results"])
 
         metadata = None
         if entity.get("metadata"):
@@ -196,6 +250,45 @@ class AzureTableStorage(ConversationStorageInterface):
         entity = self._message_to_entity(message)
         await self.table_client.create_entity(entity=entity)
 
+        indexed = self._indexed_conversations
+        if message.conversation_id in indexed:
+            indexed.move_to_end(message.conversation_id)
+        else:
+            await self._write_conversation_index(
+                message.conversation_id, entity["PartitionKey"]
+            )
+            indexed[message.conversation_id] = None
+            if len(indexed) > _INDEXED_CONVERSATIONS_MAX_SIZE:
+                indexed.popitem(last=False)
+
+    @staticmethod
+    def _index_partition_key(conversation_id: str) -> str:
+        return f"conv:{conversation_id}"
+
+    async def _write_conversation_index(self, conversation_id: str, user_id: str):
+        """Record the owning partition for a conversation (first writer wins)."""
+        try:
+            await self.table_client.create_entity(
+                entity={
+                    "PartitionKey": self._index_partition_key(conversation_id),
+                    "RowKey": "meta",
+                    "user_id": user_id,
+                }
+            )
+        except ResourceExistsError:
+            pass
+
+    async def _get_indexed_owner(self, conversation_id: str) -> Optional[str]:
+        """Point-read the conversation index; None for unindexed conversations."""
+        try:
+            entity = await self.table_client.get_entity(
+                partition_key=self._index_partition_key(conversation_id),
+                row_key="meta",
+            )
+        except ResourceNotFoundError:
+            return None
+        return entity.get("user_id")
+
     async def get_messages(
         self, conversation_id: str, limit: int = 100
     ) -> List[ConversationMessage]:
@@ -211,8 +304,18 @@ class AzureTableStorage(ConversationStorageInterface):
         """
         await self._ensure_table_exists()
 
-        # Query for all messages with this conversation_id (cross-partition query)
-        query_filter = f"conversation_id eq '{conversation_id}'"
+        owner = await self._get_indexed_owner(conversation_id)
+        if owner is not None:
+            # Range query within the owner's partition; RowKeys sort by
+            # timestamp, so results already come back in order
+            query_filter = (
+                f"PartitionKey eq '{owner}' and RowKey ge '{conversation_id}_' "
+                f"and RowKey lt '{conversation_id}_~' "
+                f"and conversation_id eq '{conversation_id}'"
+            )
+        else:
+            # Unindexed conversation: cross-partition query
+            query_filter = f"conversation_id eq '{conversation_id}'"
 
         entities = self.table_client.query_entities(
             query_filter=query_filter,
@@ -227,19 +330,54 @@ class AzureTableStorage(ConversationStorageInterface):
                 "metadata",
                 "site",
             ],
+            # Don't fetch a full default page (1000) when fewer are needed
+            results_per_page=min(limit, 1000),
         )
 
         messages = []
+        append = messages.append
+        to_message = self._entity_to_message
         async for entity in entities:
-            messages.append(self._entity_to_message(entity))
+            append(to_message(entity))
             if len(messages) >= limit:
                 break
 
-        # Sort by timestamp
-        messages.sort(key=lambda m: m.timestamp)
+        if owner is None:
+            # Sort by timestamp
+            messages.sort(key=lambda m: m.timestamp)
 
         return messages
 
+    async def get_conversation_owner(self, conversation_id: str) -> Optional[str]:
+        """
+        Get the user ID that owns a conversation.
+
+        Args:
+            conversation_id: The conversation ID
+
+        Returns:
+            The owner's user ID, or None if not found
+        """
+        await self._ensure_table_exists()
+
+        owner = await self._get_indexed_owner(conversation_id)
+        if owner is not None:
+            return owner
+
+        query_filter = f"conversation_id eq '{conversation_id}'"
+
+        # Only the metadata column is needed; stop at the first entity
+        entities = self.table_client.query_entities(
+            query_filter=query_filter, select=["metadata"], results_per_page=1
+        )
+
+        async for entity in entities:
+            if not entity.get("metadata"):
+                return None
+            return json.loads(entity["metadata"]).get("user_id")
+
+        return None
+
     async def get_user_conversations(self, user_id: str, limit: int = 20) -> List[str]:
         """
         Get conversation IDs for a specific user.
@@ -295,11 +433,55 @@ class AzureTableStorage(ConversationStorageInterface):
             query_filter=query_filter, select=["PartitionKey", "RowKey"]
         )
 
-        # Delete each entity
+        # Group by partition: a transaction may only touch a single partition
+        partitions: dict[str, list[str]] = {}
         async for entity in entities:
+            partitions.setdefault(entity["PartitionKey"], []).append(entity["RowKey"])
+        partitions[self._index_partition_key(conversation_id)] = ["meta"]
+        self._indexed_conversations.pop(conversation_id, None)
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_DELETES)
+        await asyncio.gather(
+            *(
+                self._delete_batch(
+                    partition_key,
+                    row_keys[start : start + _TRANSACTION_BATCH_SIZE],
+                    semaphore,
+                )
+                for partition_key, row_keys in partitions.items()
+                for start in range(0, len(row_keys), _TRANSACTION_BATCH_SIZE)
+            )
+        )
+
+    async def _delete_batch(
+        self, partition_key: str, row_keys: List[str], semaphore: asyncio.Semaphore
+    ) -> None:
+        """Delete rows from one partition in a single transaction."""
+        operations = [
+            ("delete", {"PartitionKey": partition_key, "RowKey": row_key})
+            for row_key in row_keys
+        ]
+        try:
+            async with semaphore:
+                await self.table_client.submit_transaction(operations)
+        except TableTransactionError:
+            # The whole batch is rolled back if any delete fails (e.g. a
+            # row removed concurrently); retry this batch row by row
+            await asyncio.gather(
+                *(
+                    self._delete_row(partition_key, row_key, semaphore)
+                    for row_key in row_keys
+                )
+            )
+
+    async def _delete_row(
+        self, partition_key: str, row_key: str, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Delete a single row, ignoring rows that are already gone."""
+        async with semaphore:
             try:
                 await self.table_client.delete_entity(
-                    partition_key=entity["PartitionKey"], row_key=entity["RowKey"]
+                    partition_key=partition_key, row_key=row_key
                 )
             except ResourceNotFoundError:
                 # Entity already deleted, continue
@@ -12,9 +12,10 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 import asyncpg
+from pydantic import TypeAdapter
 
 from nlweb_core.conversation.models import ConversationMessage
 from nlweb_core.conversation.storage import ConversationStorageInterface
@@ -23,10 +24,58 @@ from nlweb_core.protocol.models import AskRequest, ResultObject
 
 logger = logging.getLogger(__name__)
 
+# json.dumps() builds a new JSONEncoder whenever it is given non-default
+# options, so keep one compact encoder for the per-message JSONB columns
+_dump_compact_json = json.JSONEncoder(separators=(",", ":")).encode
+
+# Column order of the tuples built by PostgresStorage._message_to_row
+_MESSAGE_COLUMNS = [
+    "message_id",
+    "conversation_id",
+    "user_id",
+    "site",
+    "timestamp",
+    "request",
+    "results",
+    "metadata",
+]
+
+# Validates/serializes a whole results list in one pydantic-core pass
+_results_adapter = TypeAdapter(List[ResultObject])
+
+
+# Version byte that prefixes JSONB values in PostgreSQL's binary format
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value) -> bytes:
+    """Encode a JSONB value, passing through text _message_to_row serialized."""
+    text = value if isinstance(value, str) else _dump_compact_json(value)
+    return _JSONB_VERSION + text.encode()
+
+
+def _decode_jsonb(data: bytes):
+    """Decode a JSONB value, skipping its leading version byte."""
+    return json.loads(data[1:])
+
+
+async def _init_connection(conn) -> None:
+    """Decode JSONB columns once, in asyncpg, as rows are fetched."""
+    # Binary format, because copy_records_to_table can only use binary codecs
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+
 
 class PostgresStorage(ConversationStorageInterface):
     """PostgreSQL backend for conversation storage."""
 
+    accepts_raw_results = True
+
     def __init__(self, config):
         """
         Initialize PostgreSQL storage.
@@ -39,7 +88,7 @@ class PostgresStorage(ConversationStorageInterface):
         self._schema_initialized = False
         self._schema_lock = asyncio.Lock()  # Thread-safe schema initialization
 
-    async def initialize(self):
+    async def initialize(self) -> None:
         """
         Initialize connection pool and schema.
 
@@ -65,8 +114,16 @@ class PostgresStorage(ConversationStorageInterface):
                 )
 
             try:
+                # asyncpg already prepares and caches each statement per
+                # connection; JIT compilation costs more than these small
+                # indexed queries ever save, so turn it off for the session
                 self.pool = await asyncpg.create_pool(
-                    conn_str, min_size=2, max_size=10, command_timeout=60
+                    conn_str,
+                    min_size=self.config.pool_min_size,
+                    max_size=self.config.pool_max_size,
+                    command_timeout=60,
+                    server_settings={"jit": "off"},
+                    init=_init_connection,
                 )
                 logger.info("PostgreSQL connection pool created")
             except Exception as e:
@@ -123,8 +180,11 @@ class PostgresStorage(ConversationStorageInterface):
                         await conn.execute("""
                             CREATE INDEX idx_conversation_id ON conversations(conversation_id)
                         """)
+                        # Covers user_id lookups and lets get_user_conversations
+                        # read each conversation's latest timestamp from the index
                         await conn.execute("""
-                            CREATE INDEX idx_user_id ON conversations(user_id)
+                            CREATE INDEX idx_user_conversation_timestamp
+                            ON conversations(user_id, conversation_id, timestamp DESC)
                         """)
                         await conn.execute("""
                             CREATE INDEX idx_timestamp ON conversations(timestamp)
@@ -146,30 +206,26 @@ class PostgresStorage(ConversationStorageInterface):
         user_id = message.metadata.get("user_id") if message.metadata else None
         site = message.metadata.get("site") if message.metadata else None
 
-        # Serialize request and results as JSON strings for JSONB columns
+        # Serialize request and results as JSON strings for JSONB columns,
+        # straight from the models rather than via intermediate dicts
         # by_alias=True ensures @type is used instead of schema_type
-        # Use separators=(',', ':') to remove whitespace and compress JSON
-        request_dict = (
-            message.request.model_dump(mode="json", by_alias=True)
-            if hasattr(message.request, "model_dump")
-            else message.request
+        request_json = (
+            message.request.model_dump_json(by_alias=True)
+            if hasattr(message.request, "model_dump_json")
+            else _dump_compact_json(message.request)
         )
-        request_json = json.dumps(request_dict, separators=(",", ":"))
 
         results_json = None
-        if message.results:
-            results_list = [
-                r.model_dump(mode="json", by_alias=True)
-                if hasattr(r, "model_dump")
-                else r
-                for r in message.results
-            ]
-            results_json = json.dumps(results_list, separators=(",", ":"))
+        if message.results and isinstance(message.results[0], dict):
+            # Raw result dicts from the saver are already in wire form
+            results_json = _dump_compact_json(message.results)
+        elif message.results:
+            results_json = _results_adapter.dump_json(
+                message.results, by_alias=True
+            ).decode()
 
         metadata_json = (
-            json.dumps(message.metadata, separators=(",", ":"))
-            if message.metadata
-            else None
+            _dump_compact_json(message.metadata) if message.metadata else None
         )
 
         return (
@@ -185,12 +241,13 @@ class PostgresStorage(ConversationStorageInterface):
 
     def _row_to_message(self, row: dict) -> ConversationMessage:
         """Convert database row to ConversationMessage."""
-        # asyncpg returns JSONB columns as Python dicts/lists directly
-        request = AskRequest(**row["request"])
+        # JSONB columns are decoded to Python dicts/lists by the codec
+        # registered in _init_connection
+        request = AskRequest.model_validate(row["request"])
 
         results = None
         if row.get("results"):
-            results = [ResultObject(**r) for r in row["results"]]
+            results = _results_adapter.validate_python(row["results"])
 
         metadata = row.get("metadata")
 
@@ -203,35 +260,56 @@ class PostgresStorage(ConversationStorageInterface):
             metadata=metadata,
         )
 
-    @with_db_retry(max_retries=3, initial_backoff=0.5)
     async def store_message(self, message: ConversationMessage) -> None:
         """Store a conversation message."""
+        await self.store_messages([message])
+
+    async def store_messages(self, messages: List[ConversationMessage]) -> None:
+        """Store several messages in one transaction with a single binary COPY."""
+        if not messages:
+            return
+
+        # Serialize once, outside the retried write, so retries reuse the rows
+        records = [self._message_to_row(message) for message in messages]
+        await self._write_rows(records)
+
+    @with_db_retry(max_retries=3, initial_backoff=0.5)
+    async def _write_rows(self, records: List[tuple]) -> None:
+        """Write rows built by _message_to_row."""
         await self._ensure_schema_exists()
 
         pool = await self._get_pool()
-        values = self._message_to_row(message)
 
         async with pool.acquire() as conn:
-            try:
-                await conn.execute(
-                    """
-                    INSERT INTO conversations
-                    (message_id, conversation_id, user_id, site, timestamp, request, results, metadata)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                """,
-                    *values,
-                )
-
-                logger.info(
-                    f"Stored message: conv_id={message.conversation_id}, "
-                    f"user={values[2]}, msg_id={message.message_id}"
-                )
-            except asyncpg.UniqueViolationError:
-                # Message already exists (duplicate message_id) - NOT a transient error
-                logger.warning(f"Message {message.message_id} already exists, skipping")
-            except Exception as e:
-                logger.error(f"Failed to store message: {e}", exc_info=True)
-                raise
+            async with conn.transaction():
+                # Conversation history is best-effort; don't wait on the WAL
+                # flush for every batch
+                await conn.execute("SET LOCAL synchronous_commit = off")
+                try:
+                    # Savepoint, so a failed COPY doesn't abort the transaction
+                    async with conn.transaction():
+                        await conn.copy_records_to_table(
+                            "conversations", records=records, columns=_MESSAGE_COLUMNS
+                        )
+                except (
+                    asyncpg.UniqueViolationError,
+                    asyncpg.InsufficientPrivilegeError,
+                ) as e:
+                    # COPY is all-or-nothing and may not be permitted; fall back
+                    # to a batched INSERT that skips messages that already exist
+                    logger.warning(f"COPY failed ({e}), falling back to INSERT")
+                    await conn.executemany(
+                        """
+                        INSERT INTO conversations
+                        (message_id, conversation_id, user_id, site, timestamp,
+                         request, results, metadata)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                        ON CONFLICT (message_id) DO NOTHING
+                    """,
+                        records,
+                    )
+
+            logger.info(f"Stored {len(records)} messages")
 
     @with_db_retry(max_retries=3, initial_backoff=0.5)
     async def get_messages(
@@ -262,6 +340,52 @@ class PostgresStorage(ConversationStorageInterface):
             )
             return messages
 
+    async def iter_messages(
+        self, conversation_id: str, limit: int = 100, batch_size: int = 50
+    ) -> AsyncIterator[ConversationMessage]:
+        """Stream messages for a conversation through a server-side cursor."""
+        # Not retried: with_db_retry can't restart a generator mid-stream
+        await self._ensure_schema_exists()
+
+        pool = await self._get_pool()
+
+        async with pool.acquire() as conn:
+            # Cursors only live inside a transaction
+            async with conn.transaction():
+                async for row in conn.cursor(
+                    """
+                    SELECT message_id, conversation_id, user_id, site, timestamp,
+                           request, results, metadata
+                    FROM conversations
+                    WHERE conversation_id = $1
+                    ORDER BY timestamp ASC
+                    LIMIT $2
+                """,
+                    conversation_id,
+                    limit,
+                    prefetch=batch_size,
+                ):
+                    yield self._row_to_message(dict(row))
+
+    @with_db_retry(max_retries=3, initial_backoff=0.5)
+    async def get_conversation_owner(self, conversation_id: str) -> Optional[str]:
+        """Get the user ID of a conversation's first message."""
+        await self._ensure_schema_exists()
+
+        pool = await self._get_pool()
+
+        async with pool.acquire() as conn:
+            return await conn.fetchval(
+                """
+                SELECT user_id
+                FROM conversations
+                WHERE conversation_id = $1
+                ORDER BY timestamp ASC
+                LIMIT 1
+            """,
+                conversation_id,
+            )
+
     @with_db_retry(max_retries=3, initial_backoff=0.5)
     async def get_user_conversations(self, user_id: str, limit: int = 20) -> List[str]:
         """Get conversation IDs for a user, ordered by most recent activity."""
@@ -272,10 +396,14 @@ class PostgresStorage(ConversationStorageInterface):
         async with pool.acquire() as conn:
             rows = await conn.fetch(
                 """
-                SELECT conversation_id, MAX(timestamp) as last_activity
-                FROM conversations
-                WHERE user_id = $1
-                GROUP BY conversation_id
+                SELECT conversation_id
+                FROM (
+                    SELECT DISTINCT ON (conversation_id)
+                           conversation_id, timestamp AS last_activity
+                    FROM conversations
+                    WHERE user_id = $1
+                    ORDER BY conversation_id, timestamp DESC
+                ) latest
                 ORDER BY last_activity DESC
                 LIMIT $2
             """,
@@ -308,8 +436,9 @@ class PostgresStorage(ConversationStorageInterface):
             count = int(result.split()[-1]) if result else 0
             logger.info(f"Deleted {count} messages for conversation: {conversation_id}")
 
-    async def close(self):
+    async def close(self) -> None:
         """Close connection pool."""
         if self.pool:
             await self.pool.close()
+            self.pool = None
             logger.info("PostgreSQL connection pool closed")
@@ -8,6 +8,7 @@ WARNING: This code is under development and may undergo changes in future releas
 Backwards compatibility is not guaranteed at this time.
 """
 
+import asyncio
 import uuid
 from datetime import datetime
 from typing import List, Optional
@@ -18,6 +19,19 @@ from qdrant_client.http import models
 from nlweb_core.conversation.models import ConversationMessage
 from nlweb_core.conversation.storage import ConversationStorageInterface
 
+# Payload fields that conversation queries filter or order on
+_PAYLOAD_INDEXES = (
+    ("conversation_id", models.PayloadSchemaType.KEYWORD),
+    ("user_id", models.PayloadSchemaType.KEYWORD),
+    ("metadata.user_id", models.PayloadSchemaType.KEYWORD),
+    ("timestamp", models.PayloadSchemaType.DATETIME),
+)
+
+# Concurrent store_message calls are coalesced into one upsert of at most
+# this many points, sent once the batch is full or this many seconds pass
+_UPSERT_BATCH_SIZE = 128
+_UPSERT_BATCH_DELAY = 0.05
+
 
 class QdrantStorage(ConversationStorageInterface):
     """
@@ -27,6 +41,8 @@ class QdrantStorage(ConversationStorageInterface):
     using metadata filtering to retrieve messages by conversation_id or user_id.
     """
 
+    accepts_raw_results = True
+
     def __init__(self, config):
         """
         Initialize Qdrant storage.
@@ -50,6 +66,24 @@ class QdrantStorage(ConversationStorageInterface):
         # Collection will be created on first use
         self._collection_initialized = False
 
+        # Points waiting for the next batched upsert, with their callers' futures
+        self._pending_points: list[tuple[models.PointStruct, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def initialize(self) -> None:
+        """Create the collection and its payload indexes up front."""
+        await self._ensure_collection_exists()
+
+    async def close(self) -> None:
+        """Upsert any queued points, then close the Qdrant client."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        batch, self._pending_points = self._pending_points, []
+        if batch:
+            await self._upsert_batch(batch)
+        await self.client.close()
+
     async def _ensure_collection_exists(self):
         """Create the collection if it doesn't exist."""
         if self._collection_initialized:
@@ -68,8 +102,36 @@ class QdrantStorage(ConversationStorageInterface):
                 vectors_config={},  # No vectors needed
             )
 
+        # Index the filtered fields so lookups don't scan the collection;
+        # creating an index that already exists is a no-op
+        for field_name, field_schema in _PAYLOAD_INDEXES:
+            await self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=field_schema,
+            )
+
         self._collection_initialized = True
 
+    def _message_to_point(self, message: ConversationMessage) -> models.PointStruct:
+        """Convert a message to a vectorless Qdrant point."""
+        # Convert message to dict for storage
+        if message.results and isinstance(message.results[0], dict):
+            # Raw result dicts from the saver are stored as they are
+            payload = message.model_dump(mode="json", exclude={"results"})
+            payload["results"] = message.results
+        else:
+            payload = message.model_dump(mode="json")
+        # Owner at the payload root, so user filters match a top-level key
+        payload["user_id"] = (message.metadata or {}).get("user_id")
+
+        # Store as a point with a unique ID and without vectors
+        return models.PointStruct(
+            id=str(uuid.uuid4()),
+            vector={},  # Empty vector
+            payload=payload,
+        )
+
     async def store_message(self, message: ConversationMessage) -> None:
         """
         Store a conversation message in Qdrant.
@@ -79,24 +141,64 @@ class QdrantStorage(ConversationStorageInterface):
         """
         await self._ensure_collection_exists()
 
-        # Convert message to dict for storage
-        payload = message.model_dump(mode="json")
+        point = self._message_to_point(message)
+
+        # Queue the point for a batched upsert and wait until it is written,
+        # so errors still reach the caller
+        stored = asyncio.get_running_loop().create_future()
+        self._pending_points.append((point, stored))
+        if len(self._pending_points) >= _UPSERT_BATCH_SIZE:
+            batch, self._pending_points = self._pending_points, []
+            await self._upsert_batch(batch)
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_delay())
+
+        await stored
+
+    async def store_messages(self, messages: List[ConversationMessage]) -> None:
+        """
+        Store several messages with a single upsert.
+
+        Args:
+            messages: The messages to store
+        """
+        if not messages:
+            return
 
-        # Generate a unique point ID
-        point_id = str(uuid.uuid4())
+        await self._ensure_collection_exists()
 
-        # Store as a point without vectors
         await self.client.upsert(
             collection_name=self.collection_name,
-            points=[
-                models.PointStruct(
-                    id=point_id,
-                    vector={},  # Empty vector
-                    payload=payload,
-                )
-            ],
+            points=[self._message_to_point(message) for message in messages],
         )
 
+    async def _flush_after_delay(self) -> None:
+        """Upsert whatever has been queued once the batch delay has passed."""
+        await asyncio.sleep(_UPSERT_BATCH_DELAY)
+        self._flush_task = None
+        batch, self._pending_points = self._pending_points, []
+        if batch:
+            await self._upsert_batch(batch)
+
+    async def _upsert_batch(
+        self, batch: list[tuple[models.PointStruct, asyncio.Future]]
+    ) -> None:
+        """Upsert a batch of points and resolve the waiting callers."""
+        try:
+            await self.client.upsert(
+                collection_name=self.collection_name,
+                points=[point for point, _ in batch],
+            )
+        except Exception as e:
+            for _, stored in batch:
+                if not stored.done():
+                    stored.set_exception(e)
+            return
+
+        for _, stored in batch:
+            if not stored.done():
+                stored.set_result(None)
+
     async def get_messages(
         self, conversation_id: str, limit: int = 100
     ) -> List[ConversationMessage]:
@@ -124,25 +226,51 @@ class QdrantStorage(ConversationStorageInterface):
                 ]
             ),
             limit=limit,
+            # Ordered server-side using the timestamp datetime index
+            order_by=models.OrderBy(key="timestamp", direction=models.Direction.ASC),
             with_payload=True,
             with_vectors=False,
         )
 
         points = result[0]  # First element is the list of points
 
-        # Convert points to ConversationMessage objects
-        messages = []
-        for point in points:
-            payload = point.payload
-            # Convert timestamp string back to datetime
-            if isinstance(payload.get("timestamp"), str):
-                payload["timestamp"] = datetime.fromisoformat(payload["timestamp"])
-            messages.append(ConversationMessage(**payload))
+        # Convert points to ConversationMessage objects; pydantic parses the
+        # ISO timestamp strings
+        validate = ConversationMessage.model_validate
+        return [validate(point.payload) for point in points]
 
-        # Sort by timestamp
-        messages.sort(key=lambda m: m.timestamp)
+    async def get_conversation_owner(self, conversation_id: str) -> Optional[str]:
+        """
+        Get the user ID that owns a conversation.
+
+        Args:
+            conversation_id: The conversation ID
 
-        return messages
+        Returns:
+            The owner's user ID, or None if not found
+        """
+        await self._ensure_collection_exists()
+
+        # Fetch a single point with only the owner field in its payload
+        points, _ = await self.client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key="conversation_id",
+                        match=models.MatchValue(value=conversation_id),
+                    )
+                ]
+            ),
+            limit=1,
+            with_payload=["metadata.user_id"],
+            with_vectors=False,
+        )
+
+        if not points:
+            return None
+        metadata = points[0].payload.get("metadata") or {}
+        return metadata.get("user_id")
 
     async def get_user_conversations(self, user_id: str, limit: int = 20) -> List[str]:
         """
@@ -157,18 +285,24 @@ class QdrantStorage(ConversationStorageInterface):
         """
         await self._ensure_collection_exists()
 
-        # Scroll through all points with matching user_id in metadata
+        # Scroll through all points owned by user_id
         result = await self.client.scroll(
             collection_name=self.collection_name,
+            # Points stored before user_id was copied to the payload root only
+            # have metadata.user_id
             scroll_filter=models.Filter(
-                must=[
+                should=[
+                    models.FieldCondition(
+                        key="user_id", match=models.MatchValue(value=user_id)
+                    ),
                     models.FieldCondition(
                         key="metadata.user_id", match=models.MatchValue(value=user_id)
-                    )
+                    ),
                 ]
             ),
             limit=1000,  # Get more to aggregate by conversation
-            with_payload=True,
+            # Only the fields needed for aggregation, not whole messages
+            with_payload=["conversation_id", "timestamp"],
             with_vectors=False,
         )
 
@@ -10,15 +10,61 @@ Backwards compatibility is not guaranteed at this time.
 
 import importlib
 import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Any, AsyncIterator, List, Optional
 
+from nlweb_core.conversation.auth import invalidate_conversation_owner
 from nlweb_core.conversation.models import ConversationMessage
 
+# Recent messages and conversation lists are re-read on every chat turn, so
+# they are cached briefly in front of the backend. Entries are keyed by
+# conversation or user ID and hold one result per limit, so a write can drop
+# every limit at once.
+_READ_CACHE_TTL = 30.0
+_READ_CACHE_MAX_SIZE = 10_000
+
+# Backend type -> (module path, class name)
+_BACKEND_MAP = {
+    "qdrant": ("nlweb_core.conversation.backends.qdrant", "QdrantStorage"),
+    "azure_table": (
+        "nlweb_core.conversation.backends.azure_table",
+        "AzureTableStorage",
+    ),
+    "postgres": ("nlweb_core.conversation.backends.postgres", "PostgresStorage"),
+}
+
+# Backend classes already resolved, by backend type
+_BACKEND_CLASS_CACHE: dict[str, type] = {}
+
 
 class ConversationStorageInterface(ABC):
     """Abstract interface for conversation storage backends."""
 
+    # Backends that write results straight to JSON set this, so the saver can
+    # hand them the ranked result dicts without validating them into
+    # ResultObject models first. Such backends must then accept either form
+    # in ConversationMessage.results.
+    accepts_raw_results: bool = False
+
+    async def initialize(self) -> None:
+        """
+        Open connections and create any schema the backend needs.
+
+        Called once at server startup so the first request doesn't pay for
+        it. The default does nothing.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Release the connections opened by the backend.
+
+        Called once at server shutdown. The default does nothing.
+        """
+        pass
+
     @abstractmethod
     async def store_message(self, message: ConversationMessage) -> None:
         """
@@ -29,6 +75,19 @@ class ConversationStorageInterface(ABC):
         """
         pass
 
+    async def store_messages(self, messages: List[ConversationMessage]) -> None:
+        """
+        Store several conversation messages.
+
+        Backends should override this with a bulk write; the default stores
+        the messages one at a time.
+
+        Args:
+            messages: The messages to store
+        """
+        for message in messages:
+            await self.store_message(message)
+
     @abstractmethod
     async def get_messages(
         self, conversation_id: str, limit: int = 100
@@ -45,6 +104,46 @@ class ConversationStorageInterface(ABC):
         """
         pass
 
+    async def iter_messages(
+        self, conversation_id: str, limit: int = 100, batch_size: int = 50
+    ) -> AsyncIterator[ConversationMessage]:
+        """
+        Iterate over messages for a conversation.
+
+        Backends should override this to fetch batch_size rows at a time, so
+        a caller that stops early doesn't read the rest; the default fetches
+        everything with get_messages.
+
+        Args:
+            conversation_id: The conversation ID
+            limit: Maximum number of messages to yield
+            batch_size: Number of messages to fetch per round-trip
+
+        Yields:
+            Messages ordered by timestamp
+        """
+        for message in await self.get_messages(conversation_id, limit):
+            yield message
+
+    async def get_conversation_owner(self, conversation_id: str) -> Optional[str]:
+        """
+        Get the user ID that owns a conversation.
+
+        Backends should override this with a query that fetches only the
+        owner; the default reads the whole first message.
+
+        Args:
+            conversation_id: The conversation ID
+
+        Returns:
+            The owner's user ID, or None if the conversation does not exist
+            or has no user_id
+        """
+        messages = await self.get_messages(conversation_id, limit=1)
+        if not messages or not messages[0].metadata:
+            return None
+        return messages[0].metadata.get("user_id")
+
     @abstractmethod
     async def get_user_conversations(self, user_id: str, limit: int = 20) -> List[str]:
         """
@@ -93,6 +192,42 @@ class ConversationStorageClient:
         else:
             self.backend = self._create_backend_from_config(storage_config)
 
+        self._messages_cache: OrderedDict[str, dict[int, tuple[Any, float]]] = (
+            OrderedDict()
+        )
+        self._user_conversations_cache: OrderedDict[
+            str, dict[int, tuple[Any, float]]
+        ] = OrderedDict()
+        # Bumped on every invalidation so a read that overlapped a write
+        # doesn't cache what it fetched before the write landed
+        self._cache_generation = 0
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: str, limit: int) -> Optional[Any]:
+        """Return a cached result if it hasn't expired."""
+        entry = cache.get(key, {}).get(limit)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        cache.move_to_end(key)
+        return entry[0]
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: str, limit: int, value: Any) -> None:
+        """Cache a result, evicting the least recently used key when full."""
+        cache.setdefault(key, {})[limit] = (value, time.monotonic() + _READ_CACHE_TTL)
+        cache.move_to_end(key)
+        if len(cache) > _READ_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+
+    def _invalidate(self, messages: List[ConversationMessage]) -> None:
+        """Drop cached reads that the given messages make stale."""
+        self._cache_generation += 1
+        for message in messages:
+            self._messages_cache.pop(message.conversation_id, None)
+            user_id = (message.metadata or {}).get("user_id")
+            if user_id:
+                self._user_conversations_cache.pop(user_id, None)
+
     def _create_backend_from_config(
         self, storage_config
     ) -> ConversationStorageInterface:
@@ -116,38 +251,92 @@ class ConversationStorageClient:
 
         backend_type = storage_config.type
 
-        # Map backend types to modules
-        backend_map = {
-            "qdrant": "nlweb_core.conversation.backends.qdrant.QdrantStorage",
-            "azure_table": "nlweb_core.conversation.backends.azure_table.AzureTableStorage",
-            "postgres": "nlweb_core.conversation.backends.postgres.PostgresStorage",
-        }
-
-        if backend_type not in backend_map:
+        if backend_type not in _BACKEND_MAP:
             raise ValueError(f"Unknown storage backend: {backend_type}")
 
-        # Import and instantiate the backend
-        module_path, class_name = backend_map[backend_type].rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        backend_class = getattr(module, class_name)
+        # Import the backend class on first use only
+        backend_class = _BACKEND_CLASS_CACHE.get(backend_type)
+        if backend_class is None:
+            module_path, class_name = _BACKEND_MAP[backend_type]
+            module = importlib.import_module(module_path)
+            backend_class = getattr(module, class_name)
+            _BACKEND_CLASS_CACHE[backend_type] = backend_class
 
         # Pass the storage config to the backend
         return backend_class(storage_config)
 
+    @property
+    def accepts_raw_results(self) -> bool:
+        """Whether the backend can store result dicts without validation."""
+        return self.backend.accepts_raw_results
+
+    async def initialize(self) -> None:
+        """Open the backend's connections."""
+        await self.backend.initialize()
+
+    async def close(self) -> None:
+        """Close the backend's connections."""
+        await self.backend.close()
+
     async def store_message(self, message: ConversationMessage) -> None:
         """Store a message."""
-        await self.backend.store_message(message)
+        try:
+            await self.backend.store_message(message)
+        finally:
+            self._invalidate([message])
+
+    async def store_messages(self, messages: List[ConversationMessage]) -> None:
+        """Store several messages."""
+        try:
+            await self.backend.store_messages(messages)
+        finally:
+            self._invalidate(messages)
 
     async def get_messages(
         self, conversation_id: str, limit: int = 100
     ) -> List[ConversationMessage]:
         """Get messages for a conversation."""
-        return await self.backend.get_messages(conversation_id, limit)
+        cached = self._cache_get(self._messages_cache, conversation_id, limit)
+        if cached is not None:
+            return list(cached)
+
+        generation = self._cache_generation
+        messages = await self.backend.get_messages(conversation_id, limit)
+        if generation == self._cache_generation:
+            self._cache_put(self._messages_cache, conversation_id, limit, messages)
+        return list(messages)
+
+    def iter_messages(
+        self, conversation_id: str, limit: int = 100, batch_size: int = 50
+    ) -> AsyncIterator[ConversationMessage]:
+        """Iterate over messages for a conversation, bypassing the read cache."""
+        return self.backend.iter_messages(conversation_id, limit, batch_size)
+
+    async def get_conversation_owner(self, conversation_id: str) -> Optional[str]:
+        """Get the user ID that owns a conversation."""
+        return await self.backend.get_conversation_owner(conversation_id)
 
     async def get_user_conversations(self, user_id: str, limit: int = 20) -> List[str]:
         """Get conversation IDs for a user."""
-        return await self.backend.get_user_conversations(user_id, limit)
+        cache = self._user_conversations_cache
+        cached = self._cache_get(cache, user_id, limit)
+        if cached is not None:
+            return list(cached)
+
+        generation = self._cache_generation
+        conversation_ids = await self.backend.get_user_conversations(user_id, limit)
+        if generation == self._cache_generation:
+            self._cache_put(cache, user_id, limit, conversation_ids)
+        return list(conversation_ids)
 
     async def delete_conversation(self, conversation_id: str) -> None:
         """Delete a conversation."""
-        await self.backend.delete_conversation(conversation_id)
+        try:
+            await self.backend.delete_conversation(conversation_id)
+        finally:
+            # The owner isn't known here, so drop every user's cached list
+            self._cache_generation += 1
+            self._messages_cache.pop(conversation_id, None)
+            self._user_conversations_cache.clear()
+            # The ID may be reused by another user once deleted
+            invalidate_conversation_owner(self, conversation_id)
@@ -8,19 +8,123 @@ WARNING: This code is under development and may undergo changes in future releas
 Backwards compatibility is not guaranteed at this time.
 """
 
+import asyncio
+import itertools
 import logging
-import uuid
+import os
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Awaitable, Callable, List, Optional
 
+from pydantic import TypeAdapter
+
+from nlweb_core.conversation.auth import get_authenticated_user_id
 from nlweb_core.conversation.models import ConversationMessage
 from nlweb_core.protocol.models import AskRequest, ResultObject
 
 logger = logging.getLogger(__name__)
 
+_results_adapter = TypeAdapter(List[ResultObject])
+
+_UTC = timezone.utc
+
+# During a storage outage every turn fails, and formatting a traceback for
+# each one costs real CPU; only every Nth failure logs its traceback
+_TRACEBACK_SAMPLE_RATE = 100
+_failure_count = itertools.count()
+
+
+def _sample_traceback() -> bool:
+    """Return True for the first failure and every Nth one after it."""
+    return next(_failure_count) % _TRACEBACK_SAMPLE_RATE == 0
+
+
+def _new_id() -> str:
+    """
+    Generate a UUIDv7 string: a 48-bit millisecond timestamp then random bits.
+
+    IDs still parse as UUIDs, but sort by creation time, so inserts land at
+    the end of the message and conversation ID indexes instead of at random
+    pages.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | (rand >> 68) << 64  # rand_a: 12 bits
+        | 0b10 << 62  # variant
+        | rand & ((1 << 62) - 1)  # rand_b: 62 bits
+    )
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+class AsyncBatcher:
+    """
+    Writes submitted items to storage in the background, in batches.
+
+    submit() only queues the item. A worker task drains the queue while it
+    is non-empty, handing everything queued so far (up to max_batch_size)
+    to a single store_batch call. An idle saver therefore writes each turn
+    right away, while turns that arrive during a write are coalesced into
+    the next one.
+    """
+
+    def __init__(
+        self,
+        store_batch: Callable[[list], Awaitable[Any]],
+        max_batch_size: int = 100,
+        max_queue_size: int = 10_000,
+    ):
+        self._store_batch = store_batch
+        self._max_batch_size = max_batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._worker: Optional[asyncio.Task] = None
+
+    def submit(self, item: Any) -> None:
+        """Queue an item for writing; drops it if the queue is full."""
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.warning("Conversation write queue is full, dropping turn")
+            return
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Wait until every queued item has been written (or has failed)."""
+        await self._queue.join()
 
-# Module-level cache for conversation storage client
+    async def _drain(self) -> None:
+        queue = self._queue
+        try:
+            while not queue.empty():
+                batch = [
+                    queue.get_nowait()
+                    for _ in range(min(queue.qsize(), self._max_batch_size))
+                ]
+                try:
+                    await self._store_batch(batch)
+                except Exception as e:
+                    # Don't fail queries if storage fails
+                    logger.error(
+                        f"Failed to save {len(batch)} conversation turn(s): "
+                        f"{type(e).__name__}: {e}",
+                        exc_info=_sample_traceback(),
+                    )
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+        finally:
+            self._worker = None
+
+
+# Module-level cache for conversation storage client, its write batcher and
+# the saver bound to both
 _conversation_storage_client = None
+_conversation_batcher: Optional[AsyncBatcher] = None
+_conversation_saver: Optional["ConversationSaver"] = None
 
 
 def get_conversation_storage_client():
@@ -30,36 +134,43 @@ def get_conversation_storage_client():
 
 def set_conversation_storage_client(client):
     """Set the conversation storage client (called at server startup)."""
-    global _conversation_storage_client
+    global _conversation_storage_client, _conversation_batcher, _conversation_saver
     _conversation_storage_client = client
+    _conversation_batcher = AsyncBatcher(client.store_messages) if client else None
+    _conversation_saver = ConversationSaver()
+
+
+def get_conversation_saver() -> "ConversationSaver":
+    """Get the saver bound to the current storage client."""
+    global _conversation_saver
+    if _conversation_saver is None:
+        _conversation_saver = ConversationSaver()
+    return _conversation_saver
+
+
+async def flush_conversation_writes() -> None:
+    """Wait for queued conversation turns to be written (called at shutdown)."""
+    if _conversation_batcher is not None:
+        await _conversation_batcher.flush()
 
 
 class ConversationSaver:
     """Handles saving conversation turns to storage."""
 
     def __init__(self):
-        self.storage_client = self._get_storage_client()
-
-    def _get_storage_client(self):
-        """Get storage client from module-level cache."""
-        return get_conversation_storage_client()
+        self.storage_client = _conversation_storage_client
+        self.batcher = _conversation_batcher
 
     def _get_or_create_conversation_id(self, request: AskRequest) -> str:
         """Get conversation_id from meta.session_context or create new one."""
         meta = request.meta
         if meta and meta.session_context and meta.session_context.conversation_id:
             return meta.session_context.conversation_id
-        return str(uuid.uuid4())
+        return _new_id()
 
     def _get_user_id(self, request: AskRequest) -> Optional[str]:
         """Extract user_id from meta.user if available."""
-        meta = request.meta
-        if meta and meta.user:
-            if isinstance(meta.user, dict):
-                return meta.user.get("id") or meta.user.get("user_id")
-            elif hasattr(meta.user, "id"):
-                return meta.user.id
-        return None
+        return get_authenticated_user_id(request.meta)
 
     async def save(
         self,
@@ -69,11 +180,14 @@ class ConversationSaver:
         """
         Save a conversation turn if conditions are met.
 
+        The turn is queued and written in the background, so storage latency
+        stays off the request path.
+
         Args:
             request: The AskRequest being processed
             results: The ranked results (list of dicts)
         """
-        if not self.storage_client:
+        if not self.storage_client or not self.batcher:
             return
 
         meta = request.meta
@@ -87,18 +201,25 @@ class ConversationSaver:
             return
 
         try:
-            # Convert result dicts to ResultObject models
+            # Backends that write results straight to JSON take the ranked
+            # dicts as they are. Otherwise validate them in one pass;
+            # ResultObject instances are passed through unchanged
             result_objects = None
             if results:
-                result_objects = [
-                    ResultObject(**r) if isinstance(r, dict) else r for r in results
-                ]
-
+                if self.storage_client.accepts_raw_results and all(
+                    isinstance(r, dict) for r in results
+                ):
+                    result_objects = results
+                else:
+                    result_objects = _results_adapter.validate_python(results)
+
+            # The request is already validated and the results were handled
+            # above, so skip re-validating them inside the message
             prefer = request.prefer
-            message = ConversationMessage(
-                message_id=str(uuid.uuid4()),
+            message = ConversationMessage.model_construct(
+                message_id=_new_id(),
                 conversation_id=self._get_or_create_conversation_id(request),
-                timestamp=datetime.now(timezone.utc),
+                timestamp=datetime.now(_UTC),
                 request=request,
                 results=result_objects,
                 metadata={
@@ -108,7 +229,10 @@ class ConversationSaver:
                 },
             )
 
-            await self.storage_client.store_message(message)
+            self.batcher.submit(message)
         except Exception as e:
             # Don't fail the query if storage fails
-            logger.error(f"Failed to save conversation turn: {e}", exc_info=True)
+            logger.error(
+                f"Failed to save conversation turn: {type(e).__name__}: {e}",
+                exc_info=_sample_traceback(),
+            )
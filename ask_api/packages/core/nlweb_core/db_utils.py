@@ -7,25 +7,73 @@ Database utility functions including retry logic for transient failures.
 
 import asyncio
 import logging
+import random
+import re
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
+# Substrings of an error's message or type name that mark it as transient.
+# Combined into one regex so a failure is scanned once, not once per pattern.
+_TRANSIENT_PATTERNS = [
+    "connection",
+    "timeout",
+    "network",
+    "broken pipe",
+    "connection reset",
+    "connection refused",
+    "too many connections",
+    "pool",
+    "deadlock",
+    "lock timeout",
+    "server closed the connection",
+    "cannot connect",
+    "could not connect",
+    "no route to host",
+    "temporary failure",
+]
+_TRANSIENT_RE = re.compile("|".join(map(re.escape, _TRANSIENT_PATTERNS)))
+
+_TRANSIENT_ERROR_TYPES: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+    OSError,
+)
+
+try:
+    import asyncpg
+
+    _TRANSIENT_ERROR_TYPES += (
+        asyncpg.TooManyConnectionsError,
+        asyncpg.ConnectionDoesNotExistError,
+        asyncpg.CannotConnectNowError,
+        asyncpg.ConnectionRejectionError,
+    )
+except ImportError:
+    pass
+
 
 def with_db_retry(
-    max_retries: int = 3, initial_backoff: float = 0.5, max_backoff: float = 10.0
+    max_retries: int = 3,
+    initial_backoff: float = 0.5,
+    max_backoff: float = 10.0,
+    semaphore: Optional[asyncio.Semaphore] = None,
 ):
     """
     Decorator that adds retry logic with exponential backoff for database operations.
 
     Retries on transient database errors like connection failures, timeouts, etc.
-    Uses exponential backoff: wait_time = initial_backoff * (2 ** attempt)
+    Uses decorrelated jitter, so callers that failed together don't all retry
+    together: wait_time = min(max_backoff, uniform(initial_backoff, 3 * previous_wait))
 
     Args:
         max_retries: Maximum number of retry attempts (default: 3)
         initial_backoff: Initial backoff time in seconds (default: 0.5)
         max_backoff: Maximum backoff time in seconds (default: 10.0)
+        semaphore: Optional semaphore shared across callers that caps how many
+            retry attempts run at once (first attempts are not gated)
 
     Usage:
         @with_db_retry(max_retries=3, initial_backoff=0.5)
@@ -33,9 +81,9 @@ def with_db_retry(
             # ... database operation ...
 
     Example:
-        Attempt 1 fails -> wait 0.5s
-        Attempt 2 fails -> wait 1.0s
-        Attempt 3 fails -> wait 2.0s
+        Attempt 1 fails -> wait 0.5-1.5s
+        Attempt 2 fails -> wait 0.5s up to 3x the previous wait
+        Attempt 3 fails -> wait 0.5s up to 3x the previous wait
         Attempt 4 fails -> raise exception
     """
 
@@ -43,10 +91,14 @@ def with_db_retry(
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
             last_exception = None
+            wait_time = initial_backoff
 
             for attempt in range(max_retries + 1):
                 try:
                     # Try the operation
+                    if attempt and semaphore is not None:
+                        async with semaphore:
+                            return await func(*args, **kwargs)
                     return await func(*args, **kwargs)
 
                 except Exception as e:
@@ -67,8 +119,12 @@ def with_db_retry(
                             )
                         raise
 
-                    # Calculate backoff time with exponential growth
-                    wait_time = min(initial_backoff * (2**attempt), max_backoff)
+                    # Decorrelated jitter: grows roughly exponentially, but
+                    # spreads out callers that failed at the same moment
+                    wait_time = min(
+                        max_backoff,
+                        random.uniform(initial_backoff, wait_time * 3),
+                    )
 
                     logger.warning(
                         f"{func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}), "
@@ -96,10 +152,9 @@ def _is_transient_error(error: Exception) -> bool:
     - Network errors
     - Some database lock errors
 
-    Non-transient errors include:
-    - Data validation errors
-    - Constraint violations
-    - Authentication failures
+    Anything else (validation errors, constraint violations, authentication
+    failures, unknown errors) is treated as non-transient so it isn't
+    retried forever.
 
     Args:
         error: The exception to check
@@ -107,84 +162,11 @@ def _is_transient_error(error: Exception) -> bool:
     Returns:
         True if error is likely transient, False otherwise
     """
-    error_str = str(error).lower()
-    error_type = type(error).__name__.lower()
-
-    # Transient error patterns
-    transient_patterns = [
-        "connection",
-        "timeout",
-        "network",
-        "broken pipe",
-        "connection reset",
-        "connection refused",
-        "too many connections",
-        "pool",
-        "deadlock",
-        "lock timeout",
-        "server closed the connection",
-        "cannot connect",
-        "could not connect",
-        "no route to host",
-        "temporary failure",
-    ]
-
-    # Check for asyncpg-specific transient errors
-    try:
-        import asyncpg
-
-        if isinstance(
-            error,
-            (
-                asyncpg.TooManyConnectionsError,
-                asyncpg.ConnectionDoesNotExistError,
-                asyncpg.CannotConnectNowError,
-                asyncpg.ConnectionRejectionError,
-            ),
-        ):
-            return True
-    except ImportError:
-        pass
-
-    # Check for general connection/timeout errors
-    if isinstance(
-        error,
-        (
-            ConnectionError,
-            ConnectionRefusedError,
-            ConnectionResetError,
-            BrokenPipeError,
-            TimeoutError,
-            asyncio.TimeoutError,
-            OSError,
-        ),
-    ):
+    # Type checks are cheapest, so they run before any string matching
+    if isinstance(error, _TRANSIENT_ERROR_TYPES):
         return True
 
-    # Check error message for transient patterns
-    for pattern in transient_patterns:
-        if pattern in error_str or pattern in error_type:
-            return True
-
-    # Non-transient error patterns (explicitly not retryable)
-    non_transient_patterns = [
-        "constraint",
-        "unique",
-        "foreign key",
-        "null value",
-        "invalid",
-        "permission",
-        "denied",
-        "authentication",
-        "syntax error",
-        "column",
-        "table",
-        "does not exist",
-    ]
-
-    for pattern in non_transient_patterns:
-        if pattern in error_str:
-            return False
-
-    # Default: assume non-transient to avoid infinite retries on unknown errors
-    return False
+    return bool(
+        _TRANSIENT_RE.search(str(error).lower())
+        or _TRANSIENT_RE.search(type(error).__name__.lower())
+    )
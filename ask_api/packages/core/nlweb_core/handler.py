@@ -8,19 +8,31 @@ WARNING: This code is under development and may undergo changes in future releas
 Backwards compatibility is not guaranteed at this time.
 """
 
+import asyncio
 import importlib
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 
 from nlweb_core.config import get_config
+from nlweb_core.conversation_saver import get_conversation_saver
+from nlweb_core.metrics import (
+    ASK_QUERY_LENGTH_CHARS,
+    ASK_RESULTS_RETURNED,
+    ASK_RETRIEVAL_DURATION,
+    ASK_SCORING_DURATION,
+)
+from nlweb_core.postQueryProcessing import PostQueryProcessing
 from nlweb_core.protocol.models import AskRequest
 from nlweb_core.query_analysis.query_analysis import (
     DefaultQueryAnalysisHandler,
     query_analysis_tree,
 )
+from nlweb_core.ranking import Ranking
 from nlweb_core.request_context import set_request_id
+from nlweb_core.retriever import enrich_results_from_object_storage
 from nlweb_core.site_config import get_elicitation_handler
 
 logger = logging.getLogger(__name__)
@@ -28,6 +40,54 @@ logger = logging.getLogger(__name__)
 # Type alias for the output method callback
 OutputMethod = Callable[[dict], Awaitable[None]] | None
 
+# Decontextualization prompt keyed by (has previous queries, has context text).
+# None means there is no context to resolve the query against.
+_DECONTEXTUALIZER_PROMPTS: dict[tuple[bool, bool], str | None] = {
+    (False, False): None,
+    (True, False): "PrevQueryDecontextualizer",
+    (False, True): "FullContextDecontextualizer",
+    (True, True): "FullContextDecontextualizer",
+}
+
+
+@dataclass(frozen=True)
+class SiteContext:
+    """Per-site settings the ask pipeline needs, resolved once per request."""
+
+    item_type: str = "item"
+    elicitation_config: Any = None
+
+
+async def get_site_context(site: str | None) -> SiteContext:
+    """
+    Resolve the item type and elicitation config for a site.
+
+    Both values come from a single lookup of the site's config document, so
+    a request makes one call into the site config provider instead of one
+    per config type. Caching and invalidation stay with the provider.
+
+    Args:
+        site: The site from the request (may be None)
+
+    Returns:
+        The site's SiteContext, or the defaults if the site has no config.
+    """
+    site_config_lookup = get_config().get_site_config_lookup("default")
+    if not site_config_lookup or not site:
+        return SiteContext()
+
+    config = await site_config_lookup.get_config(site)
+    if not config:
+        return SiteContext()
+
+    item_type = "item"
+    item_types = config.get("item_types")
+    if item_types and isinstance(item_types, list) and item_types[0]:
+        item_type = item_types[0]
+    return SiteContext(
+        item_type=item_type, elicitation_config=config.get("elicitation")
+    )
+
 
 class AskHandler(ABC):
     """Abstract base class for Ask handlers."""
@@ -69,20 +129,20 @@ class DefaultAskHandler(AskHandler):
         2. Send metadata (with correct response_type)
         3. Execute query body OR send elicitation
         4. Post-process results
-        """
-        # Build site_config with item_type for use throughout the query
-        site_config_lookup = get_config().get_site_config_lookup("default")
-        item_type = None
-        if site_config_lookup and ask_request.query.site:
-            item_types = await site_config_lookup.get_config_type(
-                ask_request.query.site, "item_types"
-            )
-            if item_types and isinstance(item_types, list) and len(item_types) > 0:
-                item_type = item_types[0]
 
-        site_config: dict[str, str] = {"item_type": item_type if item_type else "item"}
+        With nlweb.speculative_retrieval_enabled, retrieval and ranking start
+        alongside the elicitation check and are cancelled if elicitation is
+        needed, since most queries don't need it.
 
-        from nlweb_core.metrics import ASK_QUERY_LENGTH_CHARS
+        When a first-page request sets prefer.streaming, every item that
+        clears min_score is also sent as a {"partial_result": ...} frame as
+        soon as it is scored, in completion order. These can include items
+        that max_results later cuts; the final {"results": [...]} frame
+        carries the ranked page.
+        """
+        # Build site_config with item_type for use throughout the query
+        ctx = await get_site_context(ask_request.query.site)
+        site_config: dict[str, str] = {"item_type": ctx.item_type}
 
         ASK_QUERY_LENGTH_CHARS.observe(len(ask_request.query.text))
 
@@ -91,7 +151,32 @@ class DefaultAskHandler(AskHandler):
             ask_request, site_config
         )
 
-        if (elicitation_data := await self._check_elicitation(ask_request)) is not None:
+        # Partial results must not go out before the Answer meta
+        answer_started = asyncio.Event()
+        on_item = self._partial_result_sender(
+            ask_request, output_method, answer_started
+        )
+
+        # Without an nlweb section, fall back to NLWebConfig's default (on)
+        nlweb_config = get_config().nlweb
+        ranking_task = None
+        if nlweb_config is None or nlweb_config.speculative_retrieval_enabled:
+            ranking_task = asyncio.create_task(
+                self._retrieve_and_rank(ask_request, site_config, on_item)
+            )
+
+        try:
+            elicitation_data = await self._check_elicitation(
+                ask_request, ctx.elicitation_config
+            )
+        except BaseException:
+            if ranking_task:
+                await self._cancel_task(ranking_task)
+            raise
+
+        if elicitation_data is not None:
+            if ranking_task:
+                await self._cancel_task(ranking_task)
             await self._send_meta(
                 output_method, "Elicitation", ask_request.query.effective_query
             )
@@ -99,15 +184,65 @@ class DefaultAskHandler(AskHandler):
                 await output_method({"elicitation": elicitation_data})
             return
 
-        # Intentionally passing decontextualized query, or None if not.
-        await self._send_meta(
-            output_method, "Answer", ask_request.query.decontextualized_query
-        )
-        final_ranked_answers = await self._run_query_body(
-            ask_request, output_method, site_config
-        )
+        try:
+            # Intentionally passing decontextualized query, or None if not.
+            await self._send_meta(
+                output_method, "Answer", ask_request.query.decontextualized_query
+            )
+            answer_started.set()
+            if ranking_task:
+                final_ranked_answers = await ranking_task
+            else:
+                final_ranked_answers = await self._run_query_body(
+                    ask_request, output_method, site_config, on_item
+                )
+        except BaseException:
+            # e.g. the client disconnected; don't leave scoring calls running
+            if ranking_task:
+                await self._cancel_task(ranking_task)
+            raise
+        if ranking_task:
+            await self._send_results(output_method, final_ranked_answers)
         await self._post_results(ask_request, output_method, final_ranked_answers)
 
+    @staticmethod
+    async def _cancel_task(task: asyncio.Task) -> None:
+        """Cancel a speculative task and wait for it, discarding its outcome."""
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def _partial_result_sender(
+        self,
+        request: AskRequest,
+        output_method: OutputMethod,
+        answer_started: asyncio.Event,
+    ) -> Callable[[dict], Awaitable[None]] | None:
+        """
+        Build the callback that streams each result as soon as it is scored.
+
+        Only first-page requests that explicitly prefer streaming get one;
+        later pages can't tell early which items belong on them.
+
+        Args:
+            request: The ask request being processed.
+            output_method: The callback for sending results.
+            answer_started: Set once the Answer meta has been sent.
+
+        Returns:
+            The callback to pass to ranking, or None if not streaming.
+        """
+        prefer = request.prefer
+        if not (output_method and prefer and prefer.streaming):
+            return None
+        if self._get_result_offset(request):
+            return None
+
+        async def send_partial_result(result: dict) -> None:
+            await answer_started.wait()
+            await output_method({"partial_result": result})
+
+        return send_partial_result
+
     def _get_result_offset(self, request: AskRequest) -> int:
         if request.meta and request.meta.start_num:
             return request.meta.start_num
@@ -118,16 +253,27 @@ class DefaultAskHandler(AskHandler):
         request: AskRequest,
         output_method: OutputMethod,
         site_config: dict[str, str],
+        on_item: Callable[[dict], Awaitable[None]] | None = None,
     ) -> list[dict]:
         """Execute the query body by retrieving and ranking items."""
-        from nlweb_core.metrics import (
-            ASK_RESULTS_RETURNED,
-            ASK_RETRIEVAL_DURATION,
-            ASK_SCORING_DURATION,
+        final_ranked_answers = await self._retrieve_and_rank(
+            request, site_config, on_item
         )
-        from nlweb_core.ranking import Ranking
-        from nlweb_core.retriever import enrich_results_from_object_storage
+        await self._send_results(output_method, final_ranked_answers)
+        return final_ranked_answers
 
+    async def _retrieve_and_rank(
+        self,
+        request: AskRequest,
+        site_config: dict[str, str],
+        on_item: Callable[[dict], Awaitable[None]] | None = None,
+    ) -> list[dict]:
+        """
+        Retrieve and rank items without sending the final results.
+
+        on_item, if given, is passed to ranking to report each item as it is
+        scored.
+        """
         config = get_config()
 
         # Retrieval stage
@@ -156,12 +302,11 @@ class DefaultAskHandler(AskHandler):
             min_score=request.query.min_score,
             site=request.query.site,
             start_num=self._get_result_offset(request),
+            on_item=on_item,
         )
         ASK_SCORING_DURATION.observe(time.monotonic() - scoring_start)
 
         ASK_RESULTS_RETURNED.observe(len(final_ranked_answers))
-
-        await self._send_results(output_method, final_ranked_answers)
         return final_ranked_answers
 
     async def _decontextualize_query(
@@ -183,43 +328,33 @@ class DefaultAskHandler(AskHandler):
         prev_queries = (context.prev or []) if context else []
         context_text = context.text if context else None
 
-        if not prev_queries and context_text is None:
+        prompt_ref = _DECONTEXTUALIZER_PROMPTS[
+            (bool(prev_queries), context_text is not None)
+        ]
+        if prompt_ref is None:
             return None
-        elif prev_queries and context_text is None:
-            result = await DefaultQueryAnalysisHandler(
-                request,
-                prompt_ref="PrevQueryDecontextualizer",
-                root_node=query_analysis_tree,
-                site_config=site_config,
-            ).do()
-            return result.get("decontextualized_query") if result else None
-        else:
-            result = await DefaultQueryAnalysisHandler(
-                request,
-                prompt_ref="FullContextDecontextualizer",
-                root_node=query_analysis_tree,
-                site_config=site_config,
-            ).do()
-            return result.get("decontextualized_query") if result else None
-
-    async def _check_elicitation(self, request: AskRequest) -> dict | None:
+        result = await DefaultQueryAnalysisHandler(
+            request,
+            prompt_ref=prompt_ref,
+            root_node=query_analysis_tree,
+            site_config=site_config,
+        ).do()
+        return result.get("decontextualized_query") if result else None
+
+    async def _check_elicitation(
+        self, request: AskRequest, site_config: Any
+    ) -> dict | None:
         """
         Check if elicitation is needed for this query.
         This is called after decontextualization and query analysis.
 
         Args:
             request: The ask request to check.
+            site_config: The site's elicitation config from its SiteContext.
 
         Returns:
             Elicitation data dict if elicitation is needed, None otherwise.
         """
-        site_config_lookup = get_config().get_site_config_lookup("default")
-        if not site_config_lookup or not request.query.site:
-            return None
-
-        site_config = await site_config_lookup.get_config_type(
-            request.query.site, "elicitation"
-        )
         if not site_config:
             return None
 
@@ -281,8 +416,9 @@ class DefaultAskHandler(AskHandler):
         final_ranked_answers: list[dict],
     ) -> None:
         """Execute post-query processing (summarization, conversation storage, etc.)."""
-        from nlweb_core.conversation_saver import ConversationSaver
-        from nlweb_core.postQueryProcessing import PostQueryProcessing
+        # The turn is only queued here, so the background write overlaps
+        # with summarization instead of waiting for it
+        await get_conversation_saver().save(request, final_ranked_answers)
 
         prefer = request.prefer
         await PostQueryProcessing(site=request.query.site).process(
@@ -295,8 +431,6 @@ class DefaultAskHandler(AskHandler):
             send_results=lambda results: self._send_results(output_method, results),
         )
 
-        await ConversationSaver().save(request, final_ranked_answers)
-
 
 class SiteSelectingHandler(AskHandler):
     """
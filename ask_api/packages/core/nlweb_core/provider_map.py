@@ -11,7 +11,6 @@ providers from a config dict at construction time.
 import importlib
 import logging
 from collections.abc import Mapping
-from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import Any, Generic, Protocol, TypeVar, cast, runtime_checkable
 
@@ -38,6 +37,31 @@ class Closeable(Protocol):
 T = TypeVar("T", bound=Closeable)
 
 
+class NameOverride:
+    """
+    Context manager returned by ProviderMap.override().
+
+    A plain class rather than @contextmanager: overrides are entered per
+    request, and this avoids creating a generator and wrapper for each one.
+    """
+
+    __slots__ = ("_overrides", "_old_name", "_new_name", "_token")
+
+    def __init__(
+        self, overrides: ContextVar[dict[str, str]], old_name: str, new_name: str
+    ):
+        self._overrides = overrides
+        self._old_name = old_name
+        self._new_name = new_name
+
+    def __enter__(self) -> None:
+        current = self._overrides.get({})
+        self._token = self._overrides.set({**current, self._old_name: self._new_name})
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._overrides.reset(self._token)
+
+
 class ProviderMap(Generic[T]):
     """
     Eagerly-initialized cache for provider instances.
@@ -105,33 +129,22 @@ class ProviderMap(Generic[T]):
         if self._closed:
             raise RuntimeError(f"{self._error_prefix} has been shut down")
 
-        try:
-            overrides = self._name_overrides.get()
+        # Overrides are rare; only follow the chain when this name is remapped
+        overrides = self._name_overrides.get(None)
+        if overrides and name in overrides:
             seen: set[str] = set()
             while name in overrides and name not in seen:
                 seen.add(name)
                 name = overrides[name]
-        except LookupError:
-            pass
 
         if name not in self._providers:
             raise ValueError(f"{self._error_prefix} '{name}' is not configured")
 
         return self._providers[name]
 
-    @contextmanager
-    def override(self, old_name: str, new_name: str):
+    def override(self, old_name: str, new_name: str) -> NameOverride:
         """Temporarily remap old_name -> new_name for provider lookups."""
-        try:
-            current = self._name_overrides.get()
-        except LookupError:
-            current = {}
-        updated = {**current, old_name: new_name}
-        token = self._name_overrides.set(updated)
-        try:
-            yield
-        finally:
-            self._name_overrides.reset(token)
+        return NameOverride(self._name_overrides, old_name, new_name)
 
     async def close(self) -> None:
         """Close all providers and mark as shut down."""
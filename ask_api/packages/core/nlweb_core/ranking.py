@@ -11,6 +11,8 @@ Backwards compatibility is not guaranteed at this time.
 from __future__ import annotations
 
 import logging
+import math
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
@@ -148,8 +150,6 @@ def _apply_recency_boost(
     # Clamp recency_weight to valid range
     recency_weight = max(0.0, min(1.0, recency_weight))
 
-    import math
-
     # HACK: Age-dominant scoring
     # Age becomes primary ranking factor, LLM is tiebreaker
     # recency_weight controls how much age matters (0.9-0.98 recommended)
@@ -170,6 +170,55 @@ def _apply_recency_boost(
     return max(0, min(100, final))
 
 
+# Days after which the exponential recency boost has decayed to ~1.0x.
+# The decay rate is chosen so that magnitude * exp(-rate * threshold) ~= 0.01,
+# i.e. rate = -ln(0.01) / threshold ~= 0.576 for a threshold of 8 days.
+_RECENCY_BOOST_AGE_THRESHOLD = 8
+_RECENCY_BOOST_DECAY = -math.log(0.01) / _RECENCY_BOOST_AGE_THRESHOLD
+
+
+def _recency_boost_factor(age_days: int | None, boost_magnitude: float) -> float:
+    """
+    Multiplicative recency boost for an item of the given age.
+
+    Returns (1 + magnitude) at age 0, decaying exponentially towards 1.0x at
+    the age threshold. Items older than the threshold, or without an age,
+    are not boosted.
+    """
+    if age_days is None or age_days > _RECENCY_BOOST_AGE_THRESHOLD:
+        return 1.0
+    return 1.0 + boost_magnitude * math.exp(-_RECENCY_BOOST_DECAY * age_days)
+
+
+def _score_reporter(
+    items: list[RetrievedItem],
+    date_info: list[tuple[str | None, int | None]],
+    boost_magnitude: float,
+    min_score: int,
+    on_item: Callable[[dict], Awaitable[None]],
+) -> Callable[[int, float | BaseException], Awaitable[None]]:
+    """
+    Build a score_each callback that passes items clearing min_score to on_item.
+
+    Scores are boosted exactly as in the final ranking, so an item is only
+    reported early if it would also pass the threshold there.
+    """
+
+    async def report_score(index: int, score: float | BaseException) -> None:
+        if isinstance(score, BaseException):
+            return
+        final_score = score * _recency_boost_factor(
+            date_info[index][1], boost_magnitude
+        )
+        final_score = max(0, min(100, final_score))
+        if int(final_score) > min_score:
+            await on_item(
+                RankedResult(item=items[index], score=int(final_score)).to_dict()
+            )
+
+    return report_score
+
+
 class Ranking:
     def __init__(self) -> None:
         pass
@@ -183,6 +232,7 @@ class Ranking:
         min_score: int,
         start_num: int = 0,
         site: str = "all",
+        on_item: Callable[[dict], Awaitable[None]] | None = None,
     ) -> list[dict]:
         """
         Rank retrieved items by relevance to the query with freshness-aware scoring.
@@ -194,6 +244,10 @@ class Ranking:
             max_results: Maximum number of results to return
             min_score: Minimum score threshold for filtering results
             site: Site filter for site-specific recency boost configuration
+            on_item: Optional async callback, awaited with each result dict that
+                clears min_score as soon as that item is scored, in completion
+                order and before pagination. Only the per-item strategy
+                reports items early; the returned list is unaffected.
 
         Returns:
             List of ranked result dicts, sorted by score descending
@@ -223,7 +277,7 @@ class Ranking:
 
         # Extract publication dates ONLY if freshness is enabled
         # This controls both LLM awareness (via prompt) and algorithmic boost
-        date_info = []
+        date_info: list[tuple[str | None, int | None]] = []
         if freshness_enabled:
             for item in items:
                 date_str = _extract_date_published(item.schema_object)
@@ -251,14 +305,30 @@ class Ranking:
         ranking_config = config.get_ranking_config()
         scoring_questions = ranking_config.scoring_questions
 
+        # Max boost at age=0, shared by early reports and the final ranking
+        boost_magnitude = 0.0
+        if freshness_enabled and recency_config:
+            boost_magnitude = recency_config.get("recency_weight", 1.0)
+
         try:
-            # Get the scoring provider and score all items in batch
+            # Get the scoring provider and score all items, either one call
+            # per item or together, depending on the ranking strategy
             provider = config.get_scoring_provider("default")
-            scores = await provider.score_batch(
-                scoring_questions,
-                contexts,
-                timeout=8,
-            )
+            if ranking_config.strategy == "batch":
+                scores = await provider.score_combined(
+                    scoring_questions, contexts, timeout=8
+                )
+            elif on_item is not None:
+                report_score = _score_reporter(
+                    items, date_info, boost_magnitude, min_score, on_item
+                )
+                scores = await provider.score_each(
+                    scoring_questions, contexts, report_score, timeout=8
+                )
+            else:
+                scores = await provider.score_batch(
+                    scoring_questions, contexts, timeout=8
+                )
         except Exception as e:
             logger.error(f"Ranking failed: {e}", exc_info=True)
             raise
@@ -294,45 +364,25 @@ class Ranking:
         # Clean approach: multiplicative boost that decays exponentially with age
         ranked_answers: list[RankedResult] = []
 
-        if freshness_enabled and scored_items:
-            import math
-
-            # Get boost parameters from config (with sensible defaults)
-            boost_magnitude = recency_config.get(
-                "recency_weight", 1.0
-            )  # Max boost at age=0
+        if freshness_enabled and recency_config and scored_items:
             decay_rate = recency_config.get("decay_rate", 0.5)  # How fast boost decays
-            age_threshold = 8  # Days - boost becomes ~1.0x after this
-
-            # Calculate decay_rate to reach 1.0x at age_threshold
-            # We want: boost_magnitude * exp(-lambda * age_threshold) ≈ 0
-            # So: lambda = -ln(0.01) / age_threshold ≈ 0.576 for threshold=8
-            calculated_decay = -math.log(0.01) / age_threshold
-
             logger.debug(
                 f"Freshness boost enabled for {site}: "
-                f"magnitude={boost_magnitude:.2f}, decay={decay_rate:.3f}, threshold={age_threshold}d"
+                f"magnitude={boost_magnitude:.2f}, decay={decay_rate:.3f}, "
+                f"threshold={_RECENCY_BOOST_AGE_THRESHOLD}d"
             )
 
             for score, item, age_days in scored_items:
-                if age_days is not None and age_days <= age_threshold:
-                    # Exponential boost: (1 + magnitude) at age=0, 1.0x at age=threshold
-                    boost_factor = 1.0 + (
-                        boost_magnitude * math.exp(-calculated_decay * age_days)
+                boost_factor = _recency_boost_factor(age_days, boost_magnitude)
+                final_score = score * boost_factor
+                final_score = max(0, min(100, final_score))  # Clamp to 0-100
+
+                if boost_factor > 1.01:  # Only log significant boosts
+                    logger.debug(
+                        f"Recency boost for {item.url}: "
+                        f"LLM={score:.1f}, age={age_days}d, boost={boost_factor:.2f}x, final={final_score:.1f}"
                     )
 
-                    final_score = score * boost_factor
-                    final_score = max(0, min(100, final_score))  # Clamp to 0-100
-
-                    if boost_factor > 1.01:  # Only log significant boosts
-                        logger.debug(
-                            f"Recency boost for {item.url}: "
-                            f"LLM={score:.1f}, age={age_days}d, boost={boost_factor:.2f}x, final={final_score:.1f}"
-                        )
-                else:
-                    # No boost for articles > threshold or without age
-                    final_score = score
-
                 ranked_answers.append(RankedResult(item=item, score=int(final_score)))
         else:
             # No freshness: use LLM scores as-is
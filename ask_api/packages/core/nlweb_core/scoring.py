@@ -16,6 +16,7 @@ import asyncio
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Awaitable, Callable
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +131,72 @@ class ScoringLLMProvider(ABC):
         results = await asyncio.gather(*tasks, return_exceptions=True)
         return list(results)
 
+    async def score_combined(
+        self,
+        questions: list[str],
+        contexts: list[ScoringContext],
+        timeout: float = 30.0,
+        **kwargs,
+    ) -> list[float | BaseException]:
+        """
+        Score multiple contexts together, in as few requests as possible.
+
+        Used by the "batch" ranking strategy. Providers that can put several
+        items in one prompt override this; the default falls back to
+        score_batch.
+
+        Args:
+            questions: List of scoring questions to ask
+            contexts: List of contexts to score
+            timeout: Request timeout in seconds
+            **kwargs: Additional provider-specific arguments
+
+        Returns:
+            List of scores (0-100) or Exception for each context, in order
+        """
+        return await self.score_batch(questions, contexts, timeout=timeout, **kwargs)
+
+    async def score_each(
+        self,
+        questions: list[str],
+        contexts: list[ScoringContext],
+        on_score: Callable[[int, float | BaseException], Awaitable[None]],
+        timeout: float = 30.0,
+        **kwargs,
+    ) -> list[float | BaseException]:
+        """
+        Score multiple contexts in parallel, reporting each score as it arrives.
+
+        Default implementation calls score() for each context and awaits
+        on_score(index, score) as soon as that context is done, so callers
+        can act on early scores while the rest are still in flight. Providers
+        that score a batch in one request should override this.
+
+        Args:
+            questions: List of scoring questions to ask
+            contexts: List of contexts to score
+            on_score: Async callback taking the context's index and its score
+                (or the exception it failed with)
+            timeout: Request timeout in seconds
+            **kwargs: Additional provider-specific arguments
+
+        Returns:
+            List of scores (0-100) or Exception for each context, in order
+        """
+
+        async def score_one(index: int, context: ScoringContext):
+            try:
+                result = await self.score(questions, context, timeout=timeout, **kwargs)
+            except Exception as e:
+                result = e
+            await on_score(index, result)
+            return result
+
+        results = await asyncio.gather(
+            *(score_one(i, context) for i, context in enumerate(contexts))
+        )
+        return list(results)
+
     @abstractmethod
     async def close(self) -> None:
         """Close the provider and release resources."""
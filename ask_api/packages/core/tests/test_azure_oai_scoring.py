@@ -8,6 +8,7 @@ This test verifies the AzureOpenAIScoringProvider implementation
 without requiring actual Azure OpenAI credentials.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -197,6 +198,82 @@ class TestAzureOpenAIScoringProvider:
         assert all(isinstance(r, float) for r in results)
         assert all(0 <= r <= 100 for r in results)
 
+    @pytest.mark.asyncio
+    async def test_score_combined_uses_one_request(self):
+        """Test combined scoring sends all items in one prompt."""
+        provider = AzureOpenAIScoringProvider(
+            endpoint="https://test.openai.azure.com",
+            api_version="2024-02-01",
+            auth_method="api_key",
+            model="gpt-4.1-mini",
+            api_key="test-key",
+        )
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message = Mock()
+        content = '{"scores": [{"id": 2, "score": 40}, {"id": 1, "score": 120}]}'
+        mock_response.choices[0].message.content = content
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        provider._client = mock_client
+
+        contexts = [
+            ScoringContext(
+                query="pizza", item_description=f"item{i}", item_type="Recipe"
+            )
+            for i in range(3)
+        ]
+        results = await provider.score_combined(["q"], contexts, timeout=10.0)
+
+        mock_client.chat.completions.create.assert_awaited_once()
+        prompt = mock_client.chat.completions.create.call_args.kwargs["messages"][1][
+            "content"
+        ]
+        assert "[1] item0" in prompt and "[3] item2" in prompt
+        # Clamped, reordered by id, and a missing id fails only that item
+        assert results[:2] == [100.0, 40.0]
+        assert isinstance(results[2], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_score_each_reports_scores_as_they_finish(self):
+        """Test each score is reported by index as soon as its request is done."""
+        provider = AzureOpenAIScoringProvider(
+            endpoint="https://test.openai.azure.com",
+            api_version="2024-02-01",
+            auth_method="api_key",
+            model="gpt-4.1-mini",
+            api_key="test-key",
+        )
+
+        release_slow = asyncio.Event()
+        reported = []
+
+        async def fake_score(questions, context, timeout=30.0, **kwargs):
+            if context.item_description == "slow":
+                await release_slow.wait()
+                return 80.0
+            if context.item_description == "bad":
+                raise ValueError("boom")
+            return 60.0
+
+        async def on_score(index, score):
+            reported.append((index, score))
+            if len(reported) == 2:
+                release_slow.set()
+
+        provider.score = fake_score
+        contexts = [
+            ScoringContext(query="q", item_description=d)
+            for d in ("slow", "fast", "bad")
+        ]
+        results = await provider.score_each(["q"], contexts, on_score, timeout=10.0)
+
+        # The slow item is reported last but results keep input order
+        assert [index for index, _ in reported] == [1, 2, 0]
+        assert results[:2] == [80.0, 60.0]
+        assert isinstance(results[2], ValueError)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,410 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for AppConfig and the module-level provider helpers in nlweb_core.config."""
+
+import asyncio
+import dataclasses
+import subprocess
+import sys
+from typing import cast
+
+import pytest
+from nlweb_core import config as config_module
+from nlweb_core.config import (
+    AppConfig,
+    EmbeddingConfig,
+    NLWebConfig,
+    RetrievalConfig,
+    ScoringModelConfig,
+    _ensure_dir_once,
+    _env_or_literal,
+    _get_config_directory,
+    _get_config_value,
+    _read_yaml_file,
+    close_all_providers,
+    initialize_providers,
+    override_retrieval_provider,
+    override_scoring_provider,
+)
+from nlweb_core.provider_map import ProviderMap
+
+
+class FakeProvider:
+    """Minimal provider satisfying the Closeable protocol."""
+
+    def __init__(self, tier: str):
+        self.tier = tier
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _tier(provider: object) -> str:
+    """Return the tier of a provider the test installed as a FakeProvider."""
+    assert isinstance(provider, FakeProvider)
+    return provider.tier
+
+
+def _make_map(*names: str) -> ProviderMap:
+    """Build a ProviderMap with named FakeProviders, bypassing import machinery."""
+    pm = ProviderMap(config={}, error_prefix="Test provider")
+    for name in names:
+        pm._providers[name] = FakeProvider(name)
+    return pm
+
+
+@pytest.fixture
+def provider_maps(monkeypatch):
+    """Install fresh provider maps for every kind, restoring originals after."""
+    maps = {kind: _make_map("default", "alt") for kind in config_module._provider_maps}
+    monkeypatch.setattr(config_module, "_provider_maps", dict(maps))
+    return maps
+
+
+class TestGetConfigValue:
+    def test_env_var_name_is_resolved(self, monkeypatch):
+        monkeypatch.setenv("NLWEB_TEST_KEY", "secret")
+        assert _get_config_value("NLWEB_TEST_KEY") == "secret"
+
+    def test_env_suffix_is_resolved(self, monkeypatch):
+        monkeypatch.setenv("Mixed_Case_ENV", "value")
+        assert _get_config_value("Mixed_Case_ENV") == "value"
+
+    def test_unset_env_var_returns_default(self, monkeypatch):
+        monkeypatch.delenv("NLWEB_TEST_MISSING", raising=False)
+        assert _get_config_value("NLWEB_TEST_MISSING", "fallback") == "fallback"
+
+    @pytest.mark.parametrize(
+        "value", ["gpt-4.1", "http://localhost:8000/who", "GPT-4", "./data/json"]
+    )
+    def test_literal_strings_pass_through(self, value):
+        assert _get_config_value(value) == value
+
+    def test_none_returns_default(self):
+        assert _get_config_value(None, 30) == 30
+
+    def test_non_strings_pass_through(self):
+        assert _get_config_value(False, True) is False
+
+    def test_resolves_from_snapshot_when_set(self, monkeypatch):
+        monkeypatch.setenv("NLWEB_TEST_KEY", "live")
+        monkeypatch.setattr(config_module, "_env_snapshot", {"NLWEB_TEST_KEY": "snap"})
+        assert _get_config_value("NLWEB_TEST_KEY") == "snap"
+        assert _get_config_value("NLWEB_TEST_MISSING", "fallback") == "fallback"
+
+
+class TestEnvOrLiteral:
+    def test_env_key_wins(self, monkeypatch):
+        monkeypatch.setenv("NLWEB_TEST_URL", "http://env")
+        cfg = {"url_env": "NLWEB_TEST_URL", "url": "http://literal"}
+        assert _env_or_literal(cfg, "url_env", "url") == "http://env"
+
+    def test_falls_back_to_literal(self):
+        assert _env_or_literal({"url": "http://literal"}, "url_env", "url") == (
+            "http://literal"
+        )
+
+    def test_missing_both_returns_none(self):
+        assert _env_or_literal({}, "url_env", "url") is None
+
+
+def test_ensure_dir_once_creates_and_skips_repeats(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_module, "_ENSURED_DIRS", set())
+    target = tmp_path / "data" / "json"
+    _ensure_dir_once(str(target))
+    assert target.is_dir()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("makedirs should not run again for the same path")
+
+    monkeypatch.setattr(config_module.os, "makedirs", fail)
+    _ensure_dir_once(str(target))
+
+
+def test_config_directory_follows_env_changes(tmp_path, monkeypatch):
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    monkeypatch.setenv("NLWEB_CONFIG_DIR", str(first))
+    assert _get_config_directory() == str(first)
+    monkeypatch.setenv("NLWEB_CONFIG_DIR", str(second))
+    assert _get_config_directory() == str(second)
+
+
+def test_import_does_not_load_yaml_or_dotenv():
+    """Only load_config() needs the parsers; plain imports of the module should not."""
+    code = (
+        "import sys, nlweb_core.config; "
+        "print(sorted({'yaml', 'dotenv'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+class TestReadYamlFile:
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("mode: testing\nsites: SITES_ENV\n")
+        return path
+
+    @pytest.fixture(autouse=True)
+    def clear_memo(self, monkeypatch):
+        monkeypatch.setattr(config_module, "_parsed_yaml_memo", {})
+
+    def test_cache_disabled_by_default(self, config_file, tmp_path, monkeypatch):
+        monkeypatch.delenv("NLWEB_CONFIG_CACHE", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        assert _read_yaml_file(str(config_file)) == {
+            "mode": "testing",
+            "sites": "SITES_ENV",
+        }
+        assert not (tmp_path / "cache").exists()
+
+    def test_cached_parse_is_reused(self, config_file, tmp_path, monkeypatch):
+        monkeypatch.setenv("NLWEB_CONFIG_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        first = _read_yaml_file(str(config_file))
+        assert len(list((tmp_path / "cache" / "nlweb").iterdir())) == 1
+
+        import yaml
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed on a cache hit")
+
+        monkeypatch.setattr(yaml, "load", fail)
+        assert _read_yaml_file(str(config_file)) == first
+
+    def test_changed_file_misses_cache(self, config_file, tmp_path, monkeypatch):
+        monkeypatch.setenv("NLWEB_CONFIG_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        _read_yaml_file(str(config_file))
+        config_file.write_text("mode: production\n")
+        assert _read_yaml_file(str(config_file)) == {"mode": "production"}
+
+    def test_unchanged_file_is_not_reparsed(self, config_file, monkeypatch):
+        monkeypatch.delenv("NLWEB_CONFIG_CACHE", raising=False)
+        first = _read_yaml_file(str(config_file))
+        first["mode"] = "mutated"
+
+        import yaml
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed for an unchanged file")
+
+        monkeypatch.setattr(yaml, "load", fail)
+        assert _read_yaml_file(str(config_file))["mode"] == "testing"
+
+
+class TestModeFlags:
+    @pytest.mark.parametrize(
+        "mode, development, testing, raise_exceptions",
+        [
+            ("production", False, False, False),
+            ("development", True, False, True),
+            ("Testing", False, True, True),
+        ],
+    )
+    def test_mode_flags(self, mode, development, testing, raise_exceptions):
+        cfg = AppConfig(mode=mode)
+        assert cfg.is_development_mode() is development
+        assert cfg.is_testing_mode() is testing
+        assert cfg.should_raise_exceptions() is raise_exceptions
+
+
+class TestFrozenSectionConfigs:
+    def test_section_config_is_read_only(self):
+        nlweb = NLWebConfig(sites=["a"])
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            setattr(nlweb, "memory_enabled", True)
+
+    def test_replace_leaves_original_untouched(self):
+        nlweb = NLWebConfig(sites=["a"])
+        variant = dataclasses.replace(nlweb, memory_enabled=True)
+        assert variant.memory_enabled and not nlweb.memory_enabled
+        assert variant.sites is nlweb.sites
+
+
+class TestLazyOAuth:
+    def test_defaults_without_oauth_file(self, tmp_path):
+        cfg = AppConfig(config_directory=str(tmp_path))
+        assert cfg.oauth_providers == {}
+        assert cfg.oauth_session_secret is None
+        assert cfg.oauth_require_auth is False
+
+    def test_oauth_file_is_read_on_first_access(self, tmp_path, monkeypatch):
+        (tmp_path / "config_oauth.json").write_text(
+            '{"auth": {"require_auth": true}, "session": {"secret_key_env": "S_ENV"}}'
+        )
+        monkeypatch.setenv("S_ENV", "secret")
+        calls = []
+        real_read = config_module._read_oauth_data
+        monkeypatch.setattr(
+            config_module,
+            "_read_oauth_data",
+            lambda directory: calls.append(directory) or real_read(directory),
+        )
+
+        cfg = AppConfig(config_directory=str(tmp_path))
+        assert calls == []
+        assert cfg.oauth_require_auth is True
+        assert cfg.oauth_session_secret == "secret"
+        assert calls == [str(tmp_path)]
+
+
+class TestGetEmbeddingConfig:
+    @pytest.fixture
+    def cfg(self):
+        return AppConfig(
+            embedding_providers={
+                "primary": EmbeddingConfig("mod.primary", "Primary"),
+                "secondary": EmbeddingConfig("mod.secondary", "Secondary"),
+            },
+            preferred_embedding_provider="primary",
+        )
+
+    def test_named_provider(self, cfg):
+        assert cfg.get_embedding_config("secondary").class_name == "Secondary"
+
+    def test_defaults_to_preferred(self, cfg):
+        assert cfg.get_embedding_config().class_name == "Primary"
+
+    def test_unknown_name_falls_back_to_preferred(self, cfg):
+        assert cfg.get_embedding_config("missing").class_name == "Primary"
+
+    def test_no_providers_returns_none(self):
+        assert AppConfig().get_embedding_config() is None
+
+    def test_provider_tables_are_read_only(self, cfg):
+        with pytest.raises(TypeError):
+            cfg.embedding_providers["other"] = EmbeddingConfig("mod.other", "Other")
+
+    def test_provider_names_are_interned(self):
+        name = "".join(["prim", "ary"])
+        assert name is not sys.intern("primary")
+        cfg = AppConfig(embedding_providers={name: EmbeddingConfig("m", "C")})
+        assert next(iter(cfg.embedding_providers)) is sys.intern("primary")
+
+    def test_unknown_preferred_is_cleared(self, caplog):
+        cfg = AppConfig(
+            embedding_providers={"primary": EmbeddingConfig("mod.primary", "Primary")},
+            preferred_embedding_provider="missing",
+        )
+        assert cfg.preferred_embedding_provider is None
+        assert cfg.get_embedding_config() is None
+        assert "Preferred embedding provider 'missing'" in caplog.text
+
+
+class TestUninitializedProviders:
+    def test_get_raises_before_initialize(self, monkeypatch):
+        monkeypatch.setattr(
+            config_module,
+            "_provider_maps",
+            dict.fromkeys(config_module._provider_maps, config_module._UNINITIALIZED),
+        )
+        with pytest.raises(RuntimeError, match="Providers not initialized"):
+            AppConfig().get_scoring_provider("default")
+
+    def test_override_raises_before_initialize(self, monkeypatch):
+        monkeypatch.setattr(
+            config_module,
+            "_provider_maps",
+            dict.fromkeys(config_module._provider_maps, config_module._UNINITIALIZED),
+        )
+        with pytest.raises(RuntimeError, match="Providers not initialized"):
+            with override_scoring_provider("default", "alt"):
+                pass
+
+
+class TestProviderOverrides:
+    def test_override_remaps_only_its_kind(self, provider_maps):
+        cfg = AppConfig()
+        with override_scoring_provider("default", "alt"):
+            assert _tier(cfg.get_scoring_provider("default")) == "alt"
+            assert _tier(cfg.get_retrieval_provider("default")) == "default"
+        assert _tier(cfg.get_scoring_provider("default")) == "default"
+
+    def test_overrides_of_different_kinds_nest(self, provider_maps):
+        cfg = AppConfig()
+        with override_scoring_provider("default", "alt"):
+            with override_retrieval_provider("default", "alt"):
+                assert _tier(cfg.get_scoring_provider("default")) == "alt"
+                assert _tier(cfg.get_retrieval_provider("default")) == "alt"
+            assert _tier(cfg.get_retrieval_provider("default")) == "default"
+
+    @pytest.mark.asyncio
+    async def test_override_does_not_leak_into_concurrent_tasks(self, provider_maps):
+        cfg = AppConfig()
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def overriding_request():
+            with override_scoring_provider("default", "alt"):
+                entered.set()
+                await release.wait()
+                return _tier(cfg.get_scoring_provider("default"))
+
+        async def plain_request():
+            await entered.wait()
+            tier = _tier(cfg.get_scoring_provider("default"))
+            release.set()
+            return tier
+
+        overridden, plain = await asyncio.gather(overriding_request(), plain_request())
+        assert overridden == "alt"
+        assert plain == "default"
+
+
+class TestInitializeProviders:
+    def test_builds_every_kind(self, provider_maps):
+        options = {"tier": "default"}
+        cfg = AppConfig(
+            embedding_providers={
+                "default": EmbeddingConfig(__name__, "FakeProvider", options)
+            },
+            retrieval_providers={
+                "default": RetrievalConfig(__name__, "FakeProvider", options)
+            },
+        )
+        initialize_providers(cfg)
+        assert _tier(cfg.get_embedding_provider("default")) == "default"
+        assert _tier(cfg.get_retrieval_provider("default")) == "default"
+        with pytest.raises(ValueError, match="not configured"):
+            cfg.get_scoring_provider("default")
+
+    def test_failure_installs_nothing(self, provider_maps):
+        before = dict(config_module._provider_maps)
+        cfg = AppConfig(
+            embedding_providers={
+                "default": EmbeddingConfig(__name__, "FakeProvider", {"tier": "x"})
+            },
+            scoring_model_providers={"broken": ScoringModelConfig(__name__, "Missing")},
+        )
+        with pytest.raises(ValueError, match="Failed to load scoring model provider"):
+            initialize_providers(cfg)
+        assert config_module._provider_maps == before
+
+
+class TestCloseAllProviders:
+    @pytest.mark.asyncio
+    async def test_closes_every_kind(self, provider_maps):
+        providers = [pm.get("default") for pm in provider_maps.values()]
+        await close_all_providers()
+        assert all(p.closed for p in providers)
+
+    @pytest.mark.asyncio
+    async def test_one_failing_map_does_not_block_others(self, provider_maps):
+        class FailingMap:
+            async def close(self):
+                raise RuntimeError("boom")
+
+        config_module._provider_maps["scoring"] = cast(ProviderMap, FailingMap())
+        providers = [
+            pm.get("default") for kind, pm in provider_maps.items() if kind != "scoring"
+        ]
+        await close_all_providers()
+        assert all(p.closed for p in providers)
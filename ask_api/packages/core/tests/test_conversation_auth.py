@@ -0,0 +1,147 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""
+Tests for conversation authorization helpers.
+"""
+
+import logging
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from nlweb_core.conversation import auth as auth_module
+from nlweb_core.conversation.auth import (
+    get_authenticated_user_id,
+    validate_conversation_access,
+)
+from nlweb_core.conversation.storage import ConversationStorageClient
+from nlweb_core.protocol.models import Meta
+
+
+class TestGetAuthenticatedUserId:
+    def test_no_meta(self):
+        assert get_authenticated_user_id(None) is None
+
+    def test_no_user(self):
+        assert get_authenticated_user_id(Meta.model_validate({})) is None
+
+    @pytest.mark.parametrize(
+        "user, expected",
+        [
+            ({"id": "u1"}, "u1"),
+            ({"user_id": "u2"}, "u2"),
+            ({"id": "u1", "user_id": "u2"}, "u1"),
+            ({"name": "nobody"}, None),
+        ],
+    )
+    def test_dict_user(self, user, expected):
+        assert (
+            get_authenticated_user_id(Meta.model_validate({"user": user})) == expected
+        )
+
+    @pytest.mark.parametrize(
+        "user, expected",
+        [
+            (SimpleNamespace(id="u1"), "u1"),
+            (SimpleNamespace(user_id="u2"), "u2"),
+            (SimpleNamespace(id=None, user_id="u2"), "u2"),
+            (SimpleNamespace(name="nobody"), None),
+        ],
+    )
+    def test_object_user(self, user, expected):
+        assert get_authenticated_user_id(Meta.model_construct(user=user)) == expected
+
+
+def make_storage(owner):
+    storage = MagicMock()
+    storage.get_conversation_owner = AsyncMock(return_value=owner)
+    return storage
+
+
+@pytest.fixture(autouse=True)
+def clear_owner_cache():
+    auth_module._OWNER_CACHES.clear()
+    yield
+    auth_module._OWNER_CACHES.clear()
+
+
+class TestValidateConversationAccess:
+    @pytest.mark.asyncio
+    async def test_owner_has_access(self):
+        assert await validate_conversation_access("c1", "u1", make_storage("u1"))
+
+    @pytest.mark.asyncio
+    async def test_other_user_denied(self):
+        assert not await validate_conversation_access("c1", "u2", make_storage("u1"))
+
+    @pytest.mark.asyncio
+    async def test_missing_owner_denied(self):
+        assert not await validate_conversation_access("c1", "u1", make_storage(None))
+
+    @pytest.mark.asyncio
+    async def test_logged_values_are_sanitized(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            await validate_conversation_access(
+                "c1\r\nFAKE", "u2", make_storage("u1\nx")
+            )
+        assert "\n" not in caplog.text.strip()
+        assert "c1\\r\\nFAKE" in caplog.text
+
+
+class TestOwnerCache:
+    @pytest.mark.asyncio
+    async def test_repeat_lookups_hit_cache(self):
+        storage = make_storage("u1")
+        assert await validate_conversation_access("c1", "u1", storage)
+        assert not await validate_conversation_access("c1", "u2", storage)
+        storage.get_conversation_owner.assert_awaited_once_with("c1")
+
+    @pytest.mark.asyncio
+    async def test_missing_owner_is_not_cached(self):
+        storage = make_storage(None)
+        await validate_conversation_access("c1", "u1", storage)
+        storage.get_conversation_owner.return_value = "u1"
+        assert await validate_conversation_access("c1", "u1", storage)
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, monkeypatch):
+        storage = make_storage("u1")
+        await validate_conversation_access("c1", "u1", storage)
+        now = time.monotonic()
+        monkeypatch.setattr(
+            auth_module.time, "monotonic", lambda: now + auth_module._OWNER_TTL + 1
+        )
+        await validate_conversation_access("c1", "u1", storage)
+        assert storage.get_conversation_owner.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(auth_module, "_OWNER_CACHE_MAX_SIZE", 2)
+        storage = make_storage("u1")
+        for conversation_id in ("c1", "c2", "c3"):
+            await validate_conversation_access(conversation_id, "u1", storage)
+        assert list(auth_module._OWNER_CACHES[storage]) == ["c2", "c3"]
+
+    @pytest.mark.asyncio
+    async def test_cache_is_per_storage_client(self):
+        first, second = make_storage("u1"), make_storage("u2")
+        assert await validate_conversation_access("c1", "u1", first)
+        assert await validate_conversation_access("c1", "u2", second)
+        assert not await validate_conversation_access("c1", "u2", first)
+
+    @pytest.mark.asyncio
+    async def test_delete_evicts_cached_owner(self):
+        backend = MagicMock(
+            get_conversation_owner=AsyncMock(return_value="u1"),
+            delete_conversation=AsyncMock(),
+        )
+        storage = ConversationStorageClient(backend=backend)
+        assert await validate_conversation_access("c1", "u1", storage)
+
+        # The ID is reused by another user after the delete
+        await storage.delete_conversation("c1")
+        backend.get_conversation_owner.return_value = "u2"
+        assert not await validate_conversation_access("c1", "u1", storage)
+        assert await validate_conversation_access("c1", "u2", storage)
@@ -2,16 +2,29 @@
 Tests for NLWeb conversation saver module.
 """
 
+import asyncio
+import time
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from nlweb_core.conversation_saver import (
+    AsyncBatcher,
     ConversationSaver,
+    _new_id,
+    flush_conversation_writes,
+    get_conversation_saver,
     get_conversation_storage_client,
     set_conversation_storage_client,
 )
-from nlweb_core.protocol.models import AskRequest, Meta, Prefer, Query, SessionContext
+from nlweb_core.protocol.models import (
+    AskRequest,
+    Meta,
+    Prefer,
+    Query,
+    ResultObject,
+    SessionContext,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -65,6 +78,16 @@ class TestConversationSaverInit:
         saver = ConversationSaver()
         assert saver.storage_client is None
 
+    def test_shared_saver_is_rebound_with_client(self):
+        """Test get_conversation_saver returns one saver per storage client."""
+        mock_client = MagicMock()
+        set_conversation_storage_client(mock_client)
+        saver = get_conversation_saver()
+        assert saver is get_conversation_saver()
+        assert saver.storage_client is mock_client
+        set_conversation_storage_client(None)
+        assert get_conversation_saver().storage_client is None
+
 
 class TestGetUserId:
     """Tests for _get_user_id method."""
@@ -135,6 +158,31 @@ class TestGetOrCreateConversationId:
         uuid.UUID(result)
 
 
+class TestNewId:
+    """Tests for the time-ordered ID generator."""
+
+    def test_is_uuid_version_7(self):
+        parsed = uuid.UUID(_new_id())
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+
+    def test_random_bits_are_read_big_endian(self):
+        random_bytes = bytes(range(1, 11))
+        now_ns = 1_700_000_000_000_000_000
+        with patch(
+            "nlweb_core.conversation_saver.os.urandom", return_value=random_bytes
+        ):
+            with patch(
+                "nlweb_core.conversation_saver.time.time_ns", return_value=now_ns
+            ):
+                assert _new_id() == "018bcfe5-6800-7010-8304-05060708090a"
+
+    def test_sorts_by_creation_time(self):
+        first = _new_id()
+        time.sleep(0.002)
+        assert _new_id() > first
+
+
 class TestSave:
     """Tests for save method."""
 
@@ -155,7 +203,8 @@ class TestSave:
         saver = ConversationSaver()
         request = make_request(remember=False, user={"id": "user-123"})
         await saver.save(request, [])
-        mock_client.store_message.assert_not_called()
+        await flush_conversation_writes()
+        mock_client.store_messages.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_returns_early_when_remember_not_set(self):
@@ -165,7 +214,8 @@ class TestSave:
         saver = ConversationSaver()
         request = make_request(user={"id": "user-123"})
         await saver.save(request, [])
-        mock_client.store_message.assert_not_called()
+        await flush_conversation_writes()
+        mock_client.store_messages.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_returns_early_when_no_user_id(self):
@@ -175,7 +225,8 @@ class TestSave:
         saver = ConversationSaver()
         request = make_request(remember=True)
         await saver.save(request, [])
-        mock_client.store_message.assert_not_called()
+        await flush_conversation_writes()
+        mock_client.store_messages.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_saves_message_when_conditions_met(self):
@@ -194,9 +245,10 @@ class TestSave:
             {"@type": "Thing", "name": "Test Result", "url": "https://example.com"}
         ]
         await saver.save(request, results)
+        await flush_conversation_writes()
 
-        mock_client.store_message.assert_called_once()
-        message = mock_client.store_message.call_args[0][0]
+        mock_client.store_messages.assert_called_once()
+        (message,) = mock_client.store_messages.call_args[0][0]
 
         assert message.conversation_id == "conv-456"
         assert message.request == request
@@ -205,6 +257,26 @@ class TestSave:
         assert message.metadata["response_format"] == "json"
         assert len(message.results) == 1
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("accepts_raw", [True, False])
+    async def test_validates_results_only_when_backend_needs_models(self, accepts_raw):
+        """Raw-capable backends get the result dicts; others get ResultObjects."""
+        mock_client = AsyncMock()
+        mock_client.accepts_raw_results = accepts_raw
+        set_conversation_storage_client(mock_client)
+        saver = ConversationSaver()
+        request = make_request(remember=True, user={"id": "user-123"})
+        result = {"@type": "Thing", "name": "Test Result"}
+        await saver.save(request, [result])
+        await flush_conversation_writes()
+
+        (message,) = mock_client.store_messages.call_args[0][0]
+        if accepts_raw:
+            assert message.results == [result]
+        else:
+            assert isinstance(message.results[0], ResultObject)
+            assert message.results[0].schema_type == "Thing"
+
     @pytest.mark.asyncio
     async def test_saves_with_empty_results(self):
         """Test saves message with empty results list."""
@@ -213,23 +285,75 @@ class TestSave:
         saver = ConversationSaver()
         request = make_request(remember=True, user={"id": "user-123"})
         await saver.save(request, [])
+        await flush_conversation_writes()
 
-        mock_client.store_message.assert_called_once()
-        message = mock_client.store_message.call_args[0][0]
+        mock_client.store_messages.assert_called_once()
+        (message,) = mock_client.store_messages.call_args[0][0]
         assert message.results is None
 
     @pytest.mark.asyncio
     async def test_logs_error_on_storage_failure(self):
         """Test logs error but doesn't raise when storage fails."""
         mock_client = AsyncMock()
-        mock_client.store_message.side_effect = Exception("Storage error")
+        mock_client.store_messages.side_effect = Exception("Storage error")
         set_conversation_storage_client(mock_client)
         with patch("nlweb_core.conversation_saver.logger") as mock_logger:
             saver = ConversationSaver()
             request = make_request(remember=True, user={"id": "user-123"})
             # Should not raise
             await saver.save(request, [])
+            await flush_conversation_writes()
             mock_logger.error.assert_called_once()
             assert (
-                "Failed to save conversation turn" in mock_logger.error.call_args[0][0]
+                "Failed to save 1 conversation turn"
+                in mock_logger.error.call_args[0][0]
             )
+
+
+class TestAsyncBatcher:
+    """Tests for the background write batcher."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_items_queued_during_a_write(self):
+        """Test items submitted while a write is in flight share the next batch."""
+        batches = []
+        release = asyncio.Event()
+
+        async def store_batch(batch):
+            batches.append(batch)
+            await release.wait()
+
+        batcher = AsyncBatcher(store_batch)
+        batcher.submit("m1")
+        await asyncio.sleep(0)
+        batcher.submit("m2")
+        batcher.submit("m3")
+        release.set()
+        await batcher.flush()
+
+        assert batches == [["m1"], ["m2", "m3"]]
+
+    @pytest.mark.asyncio
+    async def test_respects_max_batch_size(self):
+        """Test a backlog is split into batches of at most max_batch_size."""
+        store_batch = AsyncMock()
+        batcher = AsyncBatcher(store_batch, max_batch_size=2)
+        for item in ("m1", "m2", "m3"):
+            batcher.submit(item)
+        await batcher.flush()
+
+        assert [c.args[0] for c in store_batch.await_args_list] == [
+            ["m1", "m2"],
+            ["m3"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_drops_items_when_queue_is_full(self):
+        """Test submit drops items instead of growing without bound."""
+        store_batch = AsyncMock()
+        batcher = AsyncBatcher(store_batch, max_queue_size=1)
+        batcher.submit("m1")
+        batcher.submit("m2")
+        await batcher.flush()
+
+        store_batch.assert_awaited_once_with(["m1"])
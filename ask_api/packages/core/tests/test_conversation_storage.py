@@ -0,0 +1,275 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""
+Tests for conversation storage backends and the storage client.
+"""
+
+import json
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from nlweb_core.conversation.models import ConversationMessage
+from nlweb_core.conversation.storage import (
+    ConversationStorageClient,
+    ConversationStorageInterface,
+)
+from nlweb_core.protocol.models import AskRequest
+
+
+def _make_message(message_id: str, conversation_id: str = "c1", **kwargs):
+    return ConversationMessage(
+        message_id=message_id,
+        conversation_id=conversation_id,
+        timestamp=datetime.now(timezone.utc),
+        request=AskRequest.model_validate({"query": {"text": "pizza"}}),
+        **kwargs,
+    )
+
+
+class FakeCopyConnection:
+    """Connection that, like asyncpg, only COPYs through binary-format codecs."""
+
+    JSONB_COLUMNS = ("request", "results", "metadata")
+
+    def __init__(self):
+        self.codecs = {}
+        self.rows = []
+
+    async def set_type_codec(self, typename, *, encoder, decoder, schema, format):
+        self.codecs[typename] = (encoder, decoder, format)
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query, *args):
+        return "SET"
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        import asyncpg
+
+        encoder, decoder, format = self.codecs["jsonb"]
+        if format != "binary":
+            raise asyncpg.InternalClientError("no binary format encoder for type jsonb")
+        for record in records:
+            row = dict(zip(columns, record))
+            for column in self.JSONB_COLUMNS:
+                if row[column] is not None:
+                    row[column] = decoder(encoder(row[column]))
+            self.rows.append(row)
+
+
+class TestPostgresJsonbCodec:
+    @pytest.fixture
+    def storage(self):
+        pytest.importorskip("asyncpg")
+        from nlweb_core.conversation.backends.postgres import PostgresStorage
+
+        storage = PostgresStorage(SimpleNamespace())
+        storage._schema_initialized = True
+        return storage
+
+    async def test_store_messages_copies_through_registered_codec(self, storage):
+        from nlweb_core.conversation.backends.postgres import _init_connection
+
+        conn = FakeCopyConnection()
+        await _init_connection(conn)
+
+        @asynccontextmanager
+        async def acquire():
+            yield conn
+
+        storage.pool = SimpleNamespace(acquire=acquire)
+
+        results = [{"@type": "Recipe", "url": "u", "name": "n", "site": "s"}]
+        await storage.store_messages(
+            [
+                _make_message("m1", metadata={"user_id": "u1"}),
+                _make_message("m2", results=results),
+            ]
+        )
+
+        assert [row["message_id"] for row in conn.rows] == ["m1", "m2"]
+        assert conn.rows[0]["metadata"] == {"user_id": "u1"}
+        assert conn.rows[0]["request"]["query"]["text"] == "pizza"
+        assert conn.rows[1]["results"][0]["@type"] == "Recipe"
+
+    def test_jsonb_codec_uses_binary_wire_format(self):
+        pytest.importorskip("asyncpg")
+        from nlweb_core.conversation.backends.postgres import (
+            _decode_jsonb,
+            _encode_jsonb,
+        )
+
+        encoded = _encode_jsonb('{"a":1}')
+        assert encoded == b'\x01{"a":1}'
+        assert _encode_jsonb({"a": 1}) == encoded
+        assert _decode_jsonb(encoded) == json.loads('{"a":1}')
+
+
+class TestQdrantStoreMessages:
+    async def test_batch_is_written_with_one_upsert(self, tmp_path):
+        pytest.importorskip("qdrant_client")
+        from nlweb_core.conversation.backends.qdrant import QdrantStorage
+
+        storage = QdrantStorage(
+            SimpleNamespace(collection_name=None, url=None, database_path=str(tmp_path))
+        )
+        storage.client = AsyncMock()
+        storage._collection_initialized = True
+
+        messages = [
+            _make_message(f"m{i}", metadata={"user_id": "u1"}) for i in range(3)
+        ]
+        await storage.store_messages(messages)
+
+        storage.client.upsert.assert_awaited_once()
+        points = storage.client.upsert.call_args.kwargs["points"]
+        assert [point.payload["message_id"] for point in points] == ["m0", "m1", "m2"]
+        assert all(point.payload["user_id"] == "u1" for point in points)
+        assert not storage._pending_points
+
+
+class TestAzureTableIndexedConversations:
+    async def test_indexed_conversations_are_bounded(self, monkeypatch):
+        pytest.importorskip("azure.data.tables")
+        from nlweb_core.conversation.backends import azure_table
+
+        monkeypatch.setattr(azure_table, "_INDEXED_CONVERSATIONS_MAX_SIZE", 2)
+        storage = azure_table.AzureTableStorage(
+            SimpleNamespace(table_name=None, connection_string="UseDevelopmentStorage")
+        )
+        storage.table_client = AsyncMock()
+        storage._client_initialized = storage._table_initialized = True
+
+        for conversation_id in ("c1", "c2", "c1", "c3"):
+            await storage.store_message(
+                _make_message(f"m-{conversation_id}", conversation_id)
+            )
+
+        # c1 was used again after c2, so c2 is the one evicted
+        assert list(storage._indexed_conversations) == ["c1", "c3"]
+        # Messages plus one index write per newly seen conversation
+        assert storage.table_client.create_entity.await_count == 4 + 3
+
+
+class _MessageOnlyStorage(ConversationStorageInterface):
+    """Backend that only implements the abstract methods."""
+
+    def __init__(self, messages):
+        self.messages = messages
+
+    async def store_message(self, message):
+        self.messages.append(message)
+
+    async def get_messages(self, conversation_id, limit=100):
+        return self.messages[:limit]
+
+    async def get_user_conversations(self, user_id, limit=20):
+        return []
+
+    async def delete_conversation(self, conversation_id):
+        pass
+
+
+class TestDefaultGetConversationOwner:
+    async def test_reads_first_message_metadata(self):
+        backend = _MessageOnlyStorage([_make_message("m1", metadata={"user_id": "u1"})])
+        assert await backend.get_conversation_owner("c1") == "u1"
+
+    @pytest.mark.parametrize("messages", [[], [_make_message("m1")]])
+    async def test_missing_owner(self, messages):
+        assert await _MessageOnlyStorage(messages).get_conversation_owner("c1") is None
+
+
+class TestDefaultStoreMessages:
+    async def test_stores_each_message_in_order(self):
+        messages = [_make_message("m1"), _make_message("m2")]
+        backend = _MessageOnlyStorage([])
+        await backend.store_messages(messages)
+        assert backend.messages == messages
+
+
+class TestStorageLifecycle:
+    async def test_default_initialize_and_close_are_noops(self):
+        backend = _MessageOnlyStorage([])
+        await backend.initialize()
+        await backend.close()
+        assert backend.messages == []
+
+    async def test_client_delegates_to_backend(self):
+        backend = MagicMock(initialize=AsyncMock(), close=AsyncMock())
+        client = ConversationStorageClient(backend=backend)
+        await client.initialize()
+        await client.close()
+        backend.initialize.assert_awaited_once()
+        backend.close.assert_awaited_once()
+
+
+class TestStorageReadCache:
+    MESSAGE = _make_message("m1", metadata={"user_id": "u1"})
+
+    def make_client(self):
+        backend = MagicMock(
+            get_messages=AsyncMock(return_value=[self.MESSAGE]),
+            get_user_conversations=AsyncMock(return_value=["c1"]),
+            store_messages=AsyncMock(),
+            delete_conversation=AsyncMock(),
+        )
+        return ConversationStorageClient(backend=backend), backend
+
+    async def test_repeated_reads_hit_backend_once(self):
+        client, backend = self.make_client()
+        assert await client.get_messages("c1", 10) == [self.MESSAGE]
+        assert await client.get_messages("c1", 10) == [self.MESSAGE]
+        assert await client.get_user_conversations("u1") == ["c1"]
+        assert await client.get_user_conversations("u1") == ["c1"]
+        backend.get_messages.assert_awaited_once()
+        backend.get_user_conversations.assert_awaited_once()
+
+    async def test_store_invalidates_conversation_and_owner(self):
+        client, backend = self.make_client()
+        await client.get_messages("c1")
+        await client.get_user_conversations("u1")
+        await client.store_messages([self.MESSAGE])
+        await client.get_messages("c1")
+        await client.get_user_conversations("u1")
+        assert backend.get_messages.await_count == 2
+        assert backend.get_user_conversations.await_count == 2
+
+    async def test_delete_invalidates(self):
+        client, backend = self.make_client()
+        await client.get_messages("c1")
+        await client.get_user_conversations("u1")
+        await client.delete_conversation("c1")
+        await client.get_messages("c1")
+        await client.get_user_conversations("u1")
+        assert backend.get_messages.await_count == 2
+        assert backend.get_user_conversations.await_count == 2
+
+    async def test_expired_entries_are_refetched(self, monkeypatch):
+        client, backend = self.make_client()
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        await client.get_messages("c1")
+        monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+        await client.get_messages("c1")
+        assert backend.get_messages.await_count == 2
+
+
+class TestDefaultIterMessages:
+    async def test_yields_messages_up_to_limit(self):
+        messages = [_make_message(f"m{i}") for i in range(3)]
+        backend = _MessageOnlyStorage(messages)
+        assert [m async for m in backend.iter_messages("c1", limit=2)] == messages[:2]
+
+    async def test_client_delegates_without_caching(self):
+        messages = [_make_message("m1")]
+        client = ConversationStorageClient(backend=_MessageOnlyStorage(messages))
+        assert [m async for m in client.iter_messages("c1")] == messages
+        assert not client._messages_cache
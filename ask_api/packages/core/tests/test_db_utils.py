@@ -0,0 +1,52 @@
+"""
+Tests for database retry helpers.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from nlweb_core.db_utils import with_db_retry
+
+
+class TestWithDbRetry:
+    @pytest.mark.asyncio
+    async def test_jittered_waits_stay_within_bounds(self):
+        calls = 0
+
+        @with_db_retry(max_retries=3, initial_backoff=0.5, max_backoff=2.0)
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls < 4:
+                raise ConnectionError("connection reset")
+            return "ok"
+
+        with patch("nlweb_core.db_utils.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await flaky() == "ok"
+
+        waits = [c.args[0] for c in sleep.await_args_list]
+        assert len(waits) == 3
+        assert all(0.5 <= w <= 2.0 for w in waits)
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_non_transient_errors(self):
+        operation = AsyncMock(side_effect=ValueError("unique violation"))
+        wrapped = with_db_retry()(operation)
+        with pytest.raises(ValueError):
+            await wrapped()
+        operation.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_semaphore_gates_retries_only(self):
+        semaphore = asyncio.Semaphore(1)
+        held_on_attempt = []
+
+        @with_db_retry(max_retries=1, initial_backoff=0.0, semaphore=semaphore)
+        async def flaky():
+            held_on_attempt.append(semaphore.locked())
+            if len(held_on_attempt) == 1:
+                raise TimeoutError()
+
+        await flaky()
+        assert held_on_attempt == [False, True]
@@ -16,6 +16,7 @@ Each endpoint uses an interface adapter to handle protocol-specific
 formatting while routing to the appropriate NLWeb handler.
 """
 
+import dataclasses
 import os
 import time
 
@@ -23,7 +24,6 @@ from aiohttp import request, web
 from aiohttp.web_exceptions import HTTPInternalServerError
 from aiohttp.web_request import Request
 from nlweb_core.config import (
-    RankingConfig,
     get_config,
     initialize_config,
     override_ranking_config,
@@ -284,13 +284,14 @@ async def require_admin_api_key(app, handler):
     Optional API key middleware for admin endpoints.
 
     Only protects /site-configs/* endpoints if ADMIN_API_KEY environment variable is set.
-    If ADMIN_API_KEY is not set, endpoints are open (for internal use).
+    If ADMIN_API_KEY is not set, endpoints are open (for internal use). The
+    variable is read once in create_app(), not per request.
     """
 
     async def middleware(request: Request):
         # Only protect /site-configs/* endpoints
         if request.path.startswith("/site-configs"):
-            expected_key = os.getenv("ADMIN_API_KEY")
+            expected_key = app["admin_api_key"]
 
             # If ADMIN_API_KEY is set, require it
             if expected_key:
@@ -312,13 +313,21 @@ async def config_override_middleware(app, handler):
 
     Supports:
     - List params: ?scoring_questions=q1&scoring_questions=q2
+
+    Requests that repeat the configured questions run without an override.
     """
 
     async def middleware(request: Request):
         scoring_questions = request.query.getall("scoring_questions", default=[])
-        if scoring_questions:
+        if (
+            scoring_questions
+            and scoring_questions != get_config().get_ranking_config().scoring_questions
+        ):
             with override_ranking_config(
-                RankingConfig(scoring_questions=scoring_questions)
+                dataclasses.replace(
+                    get_config().get_ranking_config(),
+                    scoring_questions=scoring_questions,
+                )
             ):
                 return await handler(request)
         return await handler(request)
@@ -360,7 +369,7 @@ async def init_app(app):
 
             storage = ConversationStorageClient(config.conversation_storage)
             # Initialize pool and schema on startup to avoid first-request latency
-            await storage.backend.initialize()
+            await storage.initialize()
             app["conversation_storage"] = storage
             # Store in module-level cache so handlers can access it
             set_conversation_storage_client(storage)
@@ -400,7 +409,10 @@ async def cleanup_app(app):
     # Cleanup conversation storage
     if "conversation_storage" in app:
         try:
-            await app["conversation_storage"].backend.close()
+            from nlweb_core.conversation_saver import flush_conversation_writes
+
+            await flush_conversation_writes()
+            await app["conversation_storage"].close()
             print("Conversation storage closed")
         except Exception as e:
             print(f"Error closing conversation storage: {e}")
@@ -425,6 +437,7 @@ def create_app():
             profile_request,
         ]
     )
+    app["admin_api_key"] = os.getenv("ADMIN_API_KEY")
 
     # Add startup and cleanup hooks
     app.on_startup.append(init_app)
@@ -494,8 +507,17 @@ def main():
     host = config.server.host
     port = config.port
 
+    # Use uvloop's event loop when it is installed (it is not available on
+    # Windows); asyncpg and aiohttp socket I/O both run faster on it
+    try:
+        import uvloop
+
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = None
+
     # Run the server
-    web.run_app(app, host=host, port=port)
+    web.run_app(app, host=host, port=port, loop=loop)
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ Azure Cosmos DB implementation for site configuration lookup.
 Uses native async client for proper async/await support.
 """
 
+import asyncio
 import hashlib
 import logging
 import time
@@ -106,6 +107,8 @@ class CosmosSiteConfigLookup(SiteConfigLookup):
 
         # Initialize cache
         self.cache: Dict[str, Dict[str, Any]] = {}
+        # In-flight Cosmos reads by domain, so concurrent misses share one read
+        self._pending_reads: Dict[str, asyncio.Task] = {}
 
         logger.info(
             f"CosmosSiteConfigLookup initialized: endpoint={self._endpoint}, "
@@ -136,7 +139,6 @@ class CosmosSiteConfigLookup(SiteConfigLookup):
             Config dict or None if not found
         """
         normalized = normalize_domain(site)
-        config_id = generate_config_id(normalized)
 
         # Check cache
         if normalized in self.cache:
@@ -145,6 +147,21 @@ class CosmosSiteConfigLookup(SiteConfigLookup):
                 return entry["config"]
             del self.cache[normalized]
 
+        # Join a read already in flight for this domain, or start one
+        task = self._pending_reads.get(normalized)
+        if task is None:
+            task = asyncio.create_task(self._fetch_config(normalized))
+            self._pending_reads[normalized] = task
+            task.add_done_callback(
+                lambda done: self._forget_pending_read(normalized, done)
+            )
+        # Shielded so one cancelled caller doesn't cancel the others' read
+        return await asyncio.shield(task)
+
+    async def _fetch_config(self, normalized: str) -> Optional[Dict[str, Any]]:
+        """Read a domain's config from Cosmos DB and cache it."""
+        config_id = generate_config_id(normalized)
+
         await self._ensure_client()
         assert self._container is not None
 
@@ -153,11 +170,18 @@ class CosmosSiteConfigLookup(SiteConfigLookup):
                 item=config_id, partition_key=normalized
             )
             config = item.get("config", {})
-            self.cache[normalized] = {"config": config, "timestamp": time.time()}
-            return config
         except exceptions.CosmosResourceNotFoundError:
-            self.cache[normalized] = {"config": None, "timestamp": time.time()}
-            return None
+            config = None
+
+        # A write during the read invalidates it; don't cache the old value
+        if self._pending_reads.get(normalized) is asyncio.current_task():
+            self.cache[normalized] = {"config": config, "timestamp": time.time()}
+        return config
+
+    def _forget_pending_read(self, normalized: str, task: asyncio.Task) -> None:
+        """Drop a finished read, unless a newer one has replaced it."""
+        if self._pending_reads.get(normalized) is task:
+            del self._pending_reads[normalized]
 
     async def get_config(self, site: str) -> Optional[Dict[str, Any]]:
         """
@@ -180,10 +204,12 @@ class CosmosSiteConfigLookup(SiteConfigLookup):
         """
         if site:
             normalized = normalize_domain(site)
+            self._pending_reads.pop(normalized, None)
             if normalized in self.cache:
                 del self.cache[normalized]
                 logger.info(f"Cache invalidated for site: {normalized}")
         else:
+            self._pending_reads.clear()
             self.cache.clear()
             logger.info("Entire cache invalidated")
 
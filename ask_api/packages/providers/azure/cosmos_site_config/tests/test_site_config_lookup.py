@@ -14,6 +14,7 @@ Tests cover:
 7. Edge cases
 """
 
+import asyncio
 import hashlib
 import time as time_module
 
@@ -688,6 +689,31 @@ class TestCaching:
         assert "missing.com" in site_config_lookup.cache
         assert site_config_lookup.cache["missing.com"]["config"] is None
 
+    async def test_concurrent_misses_share_one_read(
+        self, site_config_lookup, fake_container, monkeypatch
+    ):
+        """Concurrent reads of an uncached site hit Cosmos DB once."""
+        await site_config_lookup.update_config_type("yelp.com", "a", {"x": 1})
+        site_config_lookup.cache.clear()
+
+        reads = 0
+        original_read = fake_container.read_item
+
+        async def counting_read(*args, **kwargs):
+            nonlocal reads
+            reads += 1
+            await asyncio.sleep(0)
+            return await original_read(*args, **kwargs)
+
+        monkeypatch.setattr(fake_container, "read_item", counting_read)
+
+        results = await asyncio.gather(
+            *(site_config_lookup.get_config_type("yelp.com", "a") for _ in range(5))
+        )
+
+        assert results == [{"x": 1}] * 5
+        assert reads == 1
+
 
 # =============================================================================
 # Normalization Integration Tests
@@ -5,6 +5,7 @@
 Azure OpenAI embedding provider implementation.
 """
 
+import asyncio
 import logging
 from typing import List
 
@@ -16,6 +17,8 @@ logger = logging.getLogger(__name__)
 
 MAX_SINGLE_CHARS = 20000
 MAX_BATCH_CHARS = 12000
+# The embeddings API accepts at most this many inputs per request
+MAX_BATCH_INPUTS = 2048
 
 
 class AzureOpenAIEmbeddingProvider(EmbeddingProvider):
@@ -81,9 +84,27 @@ class AzureOpenAIEmbeddingProvider(EmbeddingProvider):
         trimmed = [
             t[:MAX_BATCH_CHARS] if len(t) > MAX_BATCH_CHARS else t for t in texts
         ]
-
-        response = await self._client.embeddings.create(input=trimmed, model=self.model)
-        return [data.embedding for data in response.data]
+        if not trimmed:
+            return []
+
+        # One request per MAX_BATCH_INPUTS texts, sent concurrently
+        responses = await asyncio.gather(
+            *(
+                self._client.embeddings.create(
+                    input=trimmed[start : start + MAX_BATCH_INPUTS],
+                    model=self.model,
+                    timeout=timeout,
+                )
+                for start in range(0, len(trimmed), MAX_BATCH_INPUTS)
+            )
+        )
+
+        # Each item carries its input's index; don't rely on response order
+        embeddings: List[List[float]] = []
+        for response in responses:
+            data = sorted(response.data, key=lambda d: d.index)
+            embeddings.extend(d.embedding for d in data)
+        return embeddings
 
     async def close(self) -> None:
         """Close the Azure OpenAI client."""
@@ -20,6 +20,44 @@ from openai import AsyncAzureOpenAI
 
 logger = logging.getLogger(__name__)
 
+_FRESHNESS_GUIDANCE = (
+    "When considering relevance, factor in the item's freshness based on the "
+    "query intent:\n"
+    '- For queries asking for "latest", "recent", "new", or "today\'s" content, '
+    "give higher scores to more recent items\n"
+    "- For queries about specific events, news, or time-sensitive topics, "
+    "prioritize fresher content\n"
+    "- For evergreen topics (recipes, how-to guides, general information), "
+    "age is less important\n"
+    "- Very recent items (< 7 days) should get a bonus for time-sensitive queries"
+)
+
+# Items per request when scoring several items in one prompt
+_COMBINED_SCORING_MAX_ITEMS = 20
+
+_COMBINED_SCORING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "scores": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer", "description": "The item's number"},
+                    "score": {
+                        "type": "integer",
+                        "description": "Relevance score between 0 and 100",
+                    },
+                },
+                "required": ["id", "score"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["scores"],
+    "additionalProperties": False,
+}
+
 
 def normalize_schema_for_structured_output(schema: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -290,11 +328,7 @@ FRESHNESS CONTEXT:
 - Publication date: {context.publication_date}
 - Age: {context.age_days} days old
 
-When considering relevance, factor in the item's freshness based on the query intent:
-- For queries asking for "latest", "recent", "new", or "today's" content, give higher scores to more recent items
-- For queries about specific events, news, or time-sensitive topics, prioritize fresher content
-- For evergreen topics (recipes, how-to guides, general information), age is less important
-- Very recent items (< 7 days) should get a bonus for time-sensitive queries"""
+{_FRESHNESS_GUIDANCE}"""
 
             prompt += f"""
 
@@ -455,6 +489,159 @@ Provide a relevance score."""
         results = await asyncio.gather(*tasks, return_exceptions=True)
         return list(results)
 
+    def _build_combined_scoring_prompt(self, contexts: list[ScoringContext]) -> str:
+        """Build one prompt that asks for a score for each numbered item.
+
+        Args:
+            contexts: Item ranking contexts sharing the same query and item type
+
+        Returns:
+            Formatted prompt string
+        """
+        item_type = contexts[0].item_type or "item"
+        prompt = (
+            f"Assign a score between 0 and 100 to each of the following {item_type} "
+            "items based on how relevant it is to the user's question. Use your "
+            "knowledge from other sources, about the items, to make a judgement. "
+            "Score each item on its own merits, not relative to the others."
+        )
+
+        if any(c.publication_date and c.age_days is not None for c in contexts):
+            prompt += f"""
+
+Some items list their publication date and age. {_FRESHNESS_GUIDANCE}"""
+
+        prompt += f"""
+
+The user's question is: {contexts[0].query}
+
+The items are:"""
+        for number, context in enumerate(contexts, start=1):
+            freshness = ""
+            if context.publication_date and context.age_days is not None:
+                freshness = (
+                    f" (published {context.publication_date}, "
+                    f"{context.age_days} days old)"
+                )
+            prompt += f"\n\n[{number}]{freshness} {context.item_description}"
+
+        prompt += (
+            "\n\nReturn one score for every item, using the item's number as its id."
+        )
+        return prompt
+
+    async def _score_chunk(
+        self, contexts: list[ScoringContext], timeout: float
+    ) -> list[float | BaseException]:
+        """Score up to _COMBINED_SCORING_MAX_ITEMS contexts in one request."""
+        assert self._client is not None
+        prompt = self._build_combined_scoring_prompt(contexts)
+        system_prompt = (
+            "You are a scoring assistant. Provide a relevance score for each item."
+        )
+
+        try:
+            response = await asyncio.wait_for(
+                self._client.chat.completions.create(
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt},
+                    ],
+                    max_tokens=50 + 20 * len(contexts),
+                    temperature=0.3,  # Lower temperature for more consistent scoring
+                    top_p=0.1,
+                    stream=False,
+                    model=self.model,
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": "combined_scoring_response",
+                            "strict": True,
+                            "schema": _COMBINED_SCORING_SCHEMA,
+                        },
+                    },
+                ),
+                timeout=timeout,
+            )
+
+            if (
+                not response
+                or not response.choices
+                or not response.choices[0].message.content
+            ):
+                raise ValueError("Empty response from Azure OpenAI")
+
+            result = json.loads(response.choices[0].message.content)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Azure OpenAI scoring request timed out after {timeout}s"
+            )
+        except Exception as e:
+            raise ValueError(f"Azure OpenAI scoring failed: {e}")
+
+        scores: dict[int, float] = {}
+        for entry in result.get("scores", []):
+            score = entry.get("score")
+            if isinstance(score, (int, float)):
+                scores[entry.get("id")] = float(max(0, min(100, score)))
+
+        # Items the model skipped fail individually, like a failed per-item call
+        return [
+            scores.get(number, ValueError(f"No score returned for item {number}"))
+            for number in range(1, len(contexts) + 1)
+        ]
+
+    async def score_combined(
+        self,
+        questions: list[str],
+        contexts: list[ScoringContext],
+        timeout: float = 30.0,
+        **kwargs,
+    ) -> list[float | BaseException]:
+        """Score item ranking contexts with one request per group of items.
+
+        Items are sent _COMBINED_SCORING_MAX_ITEMS at a time, and the groups
+        run in parallel. Contexts that aren't item rankings for one query and
+        item type fall back to score_batch.
+
+        Args:
+            questions: List of scoring questions (ignored for LLM-based scoring)
+            contexts: List of contexts to score
+            timeout: Request timeout in seconds
+            **kwargs: Additional provider-specific arguments
+
+        Returns:
+            List of scores (0-100) or Exception for each context, in order
+        """
+        if not contexts:
+            return []
+        if len({(c.query, c.item_type) for c in contexts}) > 1 or not all(
+            c.item_description and c.item_type for c in contexts
+        ):
+            return await self.score_batch(
+                questions, contexts, timeout=timeout, **kwargs
+            )
+
+        await self._ensure_client()
+
+        chunks = [
+            contexts[start : start + _COMBINED_SCORING_MAX_ITEMS]
+            for start in range(0, len(contexts), _COMBINED_SCORING_MAX_ITEMS)
+        ]
+        results = await asyncio.gather(
+            *(self._score_chunk(chunk, timeout) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        scores: list[float | BaseException] = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                # A failed request fails every item it carried
+                scores.extend([result] * len(chunk))
+            else:
+                scores.extend(result)
+        return scores
+
     async def close(self) -> None:
         """Close the Azure OpenAI client and release resources."""
         if self._client is not None:
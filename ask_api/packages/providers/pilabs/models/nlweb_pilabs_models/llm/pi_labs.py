@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import cast
+from typing import Awaitable, Callable, cast
 
 import httpx
 from nlweb_core.scoring import ScoringContext, ScoringLLMProvider
@@ -92,6 +92,20 @@ class PiLabsScoringProvider(ScoringLLMProvider):
             logger.error(f"Error during Pi Labs scoring operation: {e}")
             raise
 
+    async def score_each(
+        self,
+        questions: list[str],
+        contexts: list[ScoringContext],
+        on_score: Callable[[int, float | BaseException], Awaitable[None]],
+        timeout: float = 30.0,
+        **kwargs,
+    ) -> list[float | BaseException]:
+        """Score all contexts in one API call, then report each score."""
+        scores = await self.score_batch(questions, contexts, timeout, **kwargs)
+        for index, score in enumerate(scores):
+            await on_score(index, score)
+        return scores
+
     async def close(self) -> None:
         """Close the HTTP client and release resources."""
         if self._client is not None: